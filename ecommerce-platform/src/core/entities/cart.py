@@ -1,7 +1,7 @@
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterable, List, Tuple
 
 from core.value_objects.money import Money
 
@@ -49,6 +49,11 @@ class Cart:
             # Add new item
             self.items[product_id] = CartItem(product_id, quantity, unit_price)
 
+    def add_items(self, items: Iterable[Tuple[str, int, Money]]):
+        """Add several (product_id, quantity, unit_price) items in one call"""
+        for product_id, quantity, unit_price in items:
+            self.add_item(product_id, quantity, unit_price)
+
     def remove_item(self, product_id: str):
         """Remove item completely"""
         if product_id in self.items:
@@ -1,9 +1,12 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any, Sequence, Tuple
+import string
 import uuid
 
+_formatter = string.Formatter()
+
 class NotificationType(Enum):
     ORDER_CONFIRMATION = "ORDER_CONFIRMATION"
     ORDER_SHIPPED = "ORDER_SHIPPED"
@@ -40,7 +43,12 @@ class Priority(Enum):
 
 @dataclass
 class NotificationTemplate:
-    """Template for different types of notifications"""
+    """Template for different types of notifications
+
+    Subject and body are parsed once at construction; rendering walks the
+    pre-parsed segments instead of re-tokenizing the format string, and
+    templates without any braces are returned as-is.
+    """
     template_id: str
     notification_type: NotificationType
     channel: NotificationChannel
@@ -50,44 +58,83 @@ class NotificationTemplate:
     is_active: bool = True
     created_at: datetime = field(default_factory=datetime.now)
     variables: List[str] = field(default_factory=list)
+    _subject_parts: Tuple[bool, Any] = field(init=False, repr=False, compare=False)
+    _body_parts: Tuple[bool, Any] = field(init=False, repr=False, compare=False)
+    _required_vars: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._subject_parts = self._compile(self.subject_template)
+        self._body_parts = self._compile(self.body_template)
+        self._required_vars = frozenset(self.variables)
     
     def render_subject(self, variables: Dict[str, Any]) -> str:
         """Render subject with variable substitution"""
-        return self._render_template(self.subject_template, variables)
+        return self._render_parts(self._subject_parts, variables)
     
     def render_body(self, variables: Dict[str, Any]) -> str:
         """Render body with variable substitution"""
-        return self._render_template(self.body_template, variables)
+        return self._render_parts(self._body_parts, variables)
     
     def validate_variables(self, variables: Dict[str, Any]) -> List[str]:
         """Validate that all required variables are provided"""
-        missing = []
-        for required_var in self.variables:
-            if required_var not in variables:
-                missing.append(required_var)
-        return missing
+        if self._required_vars <= variables.keys():
+            return []
+        # Keep the declared order so error messages stay stable
+        return [var for var in self.variables if var not in variables]
     
-    def _render_template(self, template: str, variables: Dict[str, Any]) -> str:
-        """Private method to render template with variables"""
-        try:
-            return template.format(**variables)
-        except KeyError as e:
-            raise ValueError(f"Missing template variable: {e}")
+    @staticmethod
+    def _compile(template: str) -> Tuple[bool, Any]:
+        """Private method to pre-parse a template, flagging literal-only ones"""
+        if '{' not in template and '}' not in template:
+            return (False, template)
+        return (True, list(_formatter.parse(template)))
+    
+    def _render_parts(self, compiled: Tuple[bool, Any], variables: Dict[str, Any]) -> str:
+        """Private method to render pre-parsed template segments with variables"""
+        has_fields, parsed = compiled
+        if not has_fields:
+            return parsed
+        
+        parts = []
+        for literal_text, field_name, format_spec, conversion in parsed:
+            parts.append(literal_text)
+            if field_name is None:
+                continue
+            try:
+                value = _formatter.get_field(field_name, (), variables)[0]
+                # Nested fields such as "{name:>{width}}" are filled in like str.format does
+                if '{' in format_spec:
+                    format_spec = format_spec.format_map(variables)
+            except KeyError as e:
+                raise ValueError(f"Missing template variable: {e}")
+            if conversion:
+                value = _formatter.convert_field(value, conversion)
+            parts.append(format(value, format_spec))
+        return ''.join(parts)
 
 @dataclass
 class NotificationPreference:
     """User preferences for different types of notifications"""
     user_id: str
     notification_type: NotificationType
-    enabled_channels: List[NotificationChannel]
+    enabled_channels: Sequence[NotificationChannel]
     is_enabled: bool = True
     quiet_hours_start: Optional[str] = None
     quiet_hours_end: Optional[str] = None
     timezone: str = "UTC"
+    enabled_channel_values: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _enabled_set: FrozenSet[NotificationChannel] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Stored as a tuple so the derived lookups below cannot go stale;
+        # to change channels, save a new preference (see update_user_preferences)
+        self.enabled_channels = tuple(self.enabled_channels)
+        self.enabled_channel_values = tuple(ch.value for ch in self.enabled_channels)
+        self._enabled_set = frozenset(self.enabled_channels)
     
     def is_channel_enabled(self, channel: NotificationChannel) -> bool:
         """Check if user has enabled this channel for this notification type"""
-        return self.is_enabled and channel in self.enabled_channels
+        return self.is_enabled and channel in self._enabled_set
     
     def is_in_quiet_hours(self, current_time: datetime = None) -> bool:
         """Check if current time is in user's quiet hours"""
@@ -12,6 +12,10 @@ class NotificationRepository(ABC):
     def save_notification(self, notification: Notification) -> Notification:
         pass
     
+    @abstractmethod
+    def save_notifications(self, notifications: List[Notification]) -> List[Notification]:
+        pass
+    
     @abstractmethod
     def find_notification(self, notification_id: str) -> Optional[Notification]:
         pass
@@ -1,3 +1,6 @@
+from bisect import bisect_right
+from collections import defaultdict
+from datetime import datetime
 from typing import Dict, List, Optional
 from threading import Lock
 
@@ -13,37 +16,43 @@ class InMemoryNotificationRepository(NotificationRepository):
     
     def __init__(self):
         self._notifications: Dict[str, Notification] = {}
+        # Per-user notifications kept sorted by created_at (oldest first)
+        self._by_user: Dict[str, List[Notification]] = defaultdict(list)
+        # created_at of each entry in _by_user, index for index, for bisecting
+        self._user_created_at: Dict[str, List[datetime]] = defaultdict(list)
+        # Notifications by the status they had when last saved; status changes
+        # are picked up on the next save, so callers save after mark_* calls
+        self._by_status: Dict[NotificationStatus, Dict[str, Notification]] = defaultdict(dict)
+        self._indexed_status: Dict[str, NotificationStatus] = {}
         self._templates: Dict[str, NotificationTemplate] = {}
         self._preferences: Dict[str, NotificationPreference] = {}
         self._lock = Lock()
     
     def save_notification(self, notification: Notification) -> Notification:
         with self._lock:
-            self._notifications[notification.notification_id] = notification
+            self._store_notification(notification)
             return notification
     
+    def save_notifications(self, notifications: List[Notification]) -> List[Notification]:
+        with self._lock:
+            for notification in notifications:
+                self._store_notification(notification)
+            return notifications
+    
     def find_notification(self, notification_id: str) -> Optional[Notification]:
         return self._notifications.get(notification_id)
     
     def find_user_notifications(self, user_id: str, limit: int = 50) -> List[Notification]:
-        user_notifications = [
-            notif for notif in self._notifications.values()
-            if notif.user_id == user_id
-        ]
-        user_notifications.sort(key=lambda x: x.created_at, reverse=True)
-        return user_notifications[:limit]
+        user_notifications = self._by_user.get(user_id)
+        if not user_notifications or limit <= 0:
+            return []
+        return user_notifications[-limit:][::-1]
     
     def find_pending_notifications(self) -> List[Notification]:
-        return [
-            notif for notif in self._notifications.values()
-            if notif.status == NotificationStatus.PENDING
-        ]
+        return self._find_by_status(NotificationStatus.PENDING)
     
     def find_failed_notifications(self) -> List[Notification]:
-        return [
-            notif for notif in self._notifications.values()
-            if notif.status == NotificationStatus.FAILED
-        ]
+        return self._find_by_status(NotificationStatus.FAILED)
     
     def save_template(self, template: NotificationTemplate) -> NotificationTemplate:
         with self._lock:
@@ -71,9 +80,47 @@ class InMemoryNotificationRepository(NotificationRepository):
         """Clear all data (useful for testing)"""
         with self._lock:
             self._notifications.clear()
+            self._by_user.clear()
+            self._user_created_at.clear()
+            self._by_status.clear()
+            self._indexed_status.clear()
             self._templates.clear()
             self._preferences.clear()
     
+    def _store_notification(self, notification: Notification) -> None:
+        """Upsert a notification and keep the per-user index in step; caller holds the lock"""
+        notification_id = notification.notification_id
+        existing = self._notifications.get(notification_id)
+        self._notifications[notification_id] = notification
+        
+        previous_status = self._indexed_status.get(notification_id)
+        if previous_status is not None:
+            del self._by_status[previous_status][notification_id]
+        self._by_status[notification.status][notification_id] = notification
+        self._indexed_status[notification_id] = notification.status
+        
+        if existing is notification:
+            return
+        
+        if existing is not None:
+            previous = self._by_user[existing.user_id]
+            index = next(i for i, n in enumerate(previous) if n is existing)
+            del previous[index]
+            del self._user_created_at[existing.user_id][index]
+        
+        keys = self._user_created_at[notification.user_id]
+        index = bisect_right(keys, notification.created_at)
+        keys.insert(index, notification.created_at)
+        self._by_user[notification.user_id].insert(index, notification)
+    
+    def _find_by_status(self, status: NotificationStatus) -> List[Notification]:
+        """Private method to list indexed notifications, skipping any changed since saving"""
+        with self._lock:
+            bucket = self._by_status.get(status)
+            if not bucket:
+                return []
+            return [notif for notif in bucket.values() if notif.status == status]
+    
     def get_stats(self) -> Dict[str, int]:
         """Get repository statistics"""
         return {
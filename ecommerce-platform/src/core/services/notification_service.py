@@ -1,4 +1,5 @@
 from typing import Dict, List, Optional, Any
+import itertools
 import logging
 import threading
 import time
@@ -156,6 +157,8 @@ class NotificationService:
         self.user_service = user_service
         self.channels: Dict[NotificationChannel, NotificationChannelInterface] = {}
         self.notification_queue = PriorityQueue()
+        # Tie-breaker so entries with equal priority and timestamp never compare their payloads
+        self._queue_sequence = itertools.count()
         self.processing_thread = None
         self.stop_processing = threading.Event()
         self.rate_limits: Dict[NotificationChannel, Dict] = {}
@@ -198,22 +201,12 @@ class NotificationService:
             else:
                 enabled_channels = list(self.channels.keys())
             
-            for channel in enabled_channels:
-                if channel not in self.channels:
-                    continue
-                
-                try:
-                    notification = self._create_notification(
-                        user_id, notification_type, channel, variables, priority
-                    )
-                    
-                    if notification:
-                        saved_notification = self.notification_repo.save_notification(notification)
-                        notifications.append(saved_notification)
-                        self._queue_notification(saved_notification)
-                        
-                except Exception as e:
-                    logger.error(f"Failed to create notification for {channel.value}: {e}")
+            for notification in self._create_notifications(
+                user_id, notification_type, enabled_channels, variables, priority
+            ):
+                saved_notification = self.notification_repo.save_notification(notification)
+                notifications.append(saved_notification)
+                self._queue_notification(saved_notification)
             
             return notifications
             
@@ -306,16 +299,19 @@ class NotificationService:
         }
         
         admin_user_ids = ['admin_1', 'admin_2']
-        notifications = []
-        for admin_id in admin_user_ids:
-            admin_notifications = self.send_notification(
-                user_id=admin_id,
-                notification_type=NotificationType.LOW_STOCK_ALERT,
-                variables=variables,
-                priority=Priority.HIGH,
-                override_preferences=True
+        channels = list(self.channels.keys())
+        # Alerts bypass preferences, so the whole fan-out is saved and queued as one batch
+        notifications = [
+            notification
+            for admin_id in admin_user_ids
+            for notification in self._create_notifications(
+                admin_id, NotificationType.LOW_STOCK_ALERT, channels, variables, Priority.HIGH
             )
-            notifications.extend(admin_notifications)
+        ]
+        
+        if notifications:
+            self.notification_repo.save_notifications(notifications)
+            self._queue_notifications(notifications)
         
         return notifications
     
@@ -336,6 +332,26 @@ class NotificationService:
         
         return self.notification_repo.save_preference(preference)
     
+    def _create_notifications(self, user_id: str, notification_type: NotificationType,
+                              channels: List[NotificationChannel], variables: Dict[str, Any],
+                              priority: Priority) -> List[Notification]:
+        """Create notifications for every registered channel in channels"""
+        notifications = []
+        for channel in channels:
+            if channel not in self.channels:
+                continue
+            
+            try:
+                notification = self._create_notification(
+                    user_id, notification_type, channel, variables, priority
+                )
+                if notification:
+                    notifications.append(notification)
+            except Exception as e:
+                logger.error(f"Failed to create notification for {channel.value}: {e}")
+        
+        return notifications
+    
     def _create_notification(self, user_id: str, notification_type: NotificationType,
                            channel: NotificationChannel, variables: Dict[str, Any],
                            priority: Priority) -> Optional[Notification]:
@@ -376,7 +392,14 @@ class NotificationService:
         """Queue notification for background processing"""
         priority_value = 5 - notification.priority.value
         timestamp = notification.created_at.timestamp()
-        self.notification_queue.put((priority_value, timestamp, notification))
+        self.notification_queue.put((priority_value, timestamp, next(self._queue_sequence), notification))
+    
+    def _queue_notifications(self, notifications: List[Notification]) -> None:
+        """Queue a same-priority batch as a single entry for background processing"""
+        first = notifications[0]
+        priority_value = 5 - first.priority.value
+        timestamp = first.created_at.timestamp()
+        self.notification_queue.put((priority_value, timestamp, next(self._queue_sequence), notifications))
     
     def _process_notification(self, notification: Notification) -> bool:
         """Process single notification"""
@@ -420,12 +443,23 @@ class NotificationService:
         while not self.stop_processing.is_set():
             try:
                 try:
-                    priority, timestamp, notification = self.notification_queue.get(timeout=1.0)
+                    priority, timestamp, _, item = self.notification_queue.get(timeout=1.0)
                 except Empty:
                     continue
                 
-                self._process_notification(notification)
-                self.notification_queue.task_done()
+                try:
+                    if isinstance(item, list):
+                        # One failing notification must not drop the rest of its batch
+                        for notification in item:
+                            try:
+                                self._process_notification(notification)
+                            except Exception as e:
+                                logger.error(f"Failed to process notification {notification.notification_id}: {e}")
+                    else:
+                        self._process_notification(item)
+                finally:
+                    # Always settle the entry, or wait_until_idle would block until its timeout
+                    self.notification_queue.task_done()
                 
             except Exception as e:
                 logger.error(f"Background processor error: {e}")
@@ -558,6 +592,15 @@ Thank you for your business!""",
             except Exception as e:
                 logger.error(f"Failed to save default template: {e}")
     
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued notification has been processed.
+
+        Returns False if the queue did not drain within ``timeout`` seconds.
+        """
+        queue = self.notification_queue
+        with queue.all_tasks_done:
+            return queue.all_tasks_done.wait_for(lambda: not queue.unfinished_tasks, timeout)
+    
     def shutdown(self) -> None:
         """Shutdown notification service"""
         self.stop_processing.set()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Mock application services used by the integration flows
+
+Stand-ins for the order and payment services that only exercise the
+notification side effects
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../src'))
+
+import random
+import uuid
+
+from core.entities.user import Customer
+from core.entities.cart import Cart
+from core.entities.order import Order
+from core.entities.payment import Payment, PaymentMethod
+
+
+class MockOrderService:
+    def __init__(self, notification_service):
+        self.notification_service = notification_service
+    
+    def place_order(self, cart: Cart, customer: Customer, payment_method: str) -> Order:
+        """Simulate order placement with notifications"""
+        # Create order from cart
+        order = Order.create_from_cart(cart, customer.user_id)
+        
+        # Create and attach payment
+        payment = Payment.create_for_order(
+            order_id=order.order_id,
+            customer_id=customer.user_id,
+            amount=cart.total_amount(),
+            method=PaymentMethod[payment_method]
+        )
+        order.attach_payment(payment)
+        
+        # Send order confirmation notification
+        if self.notification_service:
+            self.notification_service.send_order_confirmation(order, customer)
+        
+        return order
+
+class MockPaymentService:
+    def __init__(self, notification_service, rng: random.Random = None):
+        self.notification_service = notification_service
+        # Seeded so payment outcomes are reproducible across runs
+        self._rng = rng or random.Random(0)
+    
+    def process_payment(self, payment: Payment, customer_id: str) -> bool:
+        """Simulate payment processing with notifications"""
+        # Simulate payment success/failure
+        success = self._rng.random() < 0.75  # 75% success rate
+        
+        if success:
+            payment.mark_successful(f"txn_{uuid.uuid4().hex}")
+            if self.notification_service:
+                self.notification_service.send_payment_success(payment)
+        else:
+            payment.mark_failed("Insufficient funds")
+            if self.notification_service:
+                self.notification_service.send_payment_failure(payment, "Insufficient funds")
+        
+        return success
@@ -186,7 +186,8 @@ class OrderBuilder:
             # Add a default item if none provided
             self.with_item("default_product", "Default Product", 1, Money(50.0))
         
-        order = Order(self.order_id, self.customer_id, self.items, self.payment)
+        # Hand the order its own copy so later builder calls can't mutate it
+        order = Order(self.order_id, self.customer_id, list(self.items), self.payment)
         return order
 
 
@@ -316,11 +317,12 @@ class TestData:
             customer_id = "customer_123"
         
         products = TestData.sample_products()
-        return (CartBuilder()
-                .for_customer(customer_id)
-                .with_product(products[0], 1)
-                .with_product(products[1], 2)
-                .build())
+        cart = Cart(f"cart_{uuid.uuid4().hex[:8]}", customer_id)
+        cart.add_items([
+            (products[0].product_id, 1, products[0].price),
+            (products[1].product_id, 2, products[1].price)
+        ])
+        return cart
     
     @staticmethod
     def sample_order(customer_id: str = None) -> Order:
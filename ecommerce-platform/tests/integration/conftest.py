@@ -0,0 +1,116 @@
+"""
+Shared fixtures for the integration flows
+
+The notification service is session scoped, so under ``pytest -n auto``
+each xdist worker sets it up once and the flow modules run in parallel.
+"""
+
+import sys
+import os
+import logging
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../src'))
+
+import pytest
+
+from core.entities.user import Customer, Seller, Admin
+from core.entities.product import Product
+from core.entities.cart import Cart
+from core.value_objects.money import Money
+from core.services.notification_service import (
+    NotificationService, EmailNotificationChannel, SMSNotificationChannel, SlackNotificationChannel
+)
+from core.repositories.in_memory_notification_repository import InMemoryNotificationRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+def setup_notification_service() -> NotificationService:
+    """Setup notification service with all channels"""
+    logger.info("🔧 Setting up notification service...")
+    
+    notification_repo = InMemoryNotificationRepository()
+    notification_service = NotificationService(notification_repo)
+    
+    # Register channels
+    email_channel = EmailNotificationChannel({'from_email': 'noreply@ecommerce.com'})
+    sms_channel = SMSNotificationChannel({'from_number': '+1234567890'})
+    slack_channel = SlackNotificationChannel({'channel': '#ecommerce-alerts'})
+    
+    notification_service.register_channel(email_channel)
+    notification_service.register_channel(sms_channel)
+    notification_service.register_channel(slack_channel)
+    
+    logger.info("✅ Notification service setup complete!")
+    return notification_service
+
+
+@pytest.fixture(scope="session")
+def notification_service():
+    """Notification service shared by every flow in the session"""
+    service = setup_notification_service()
+    yield service
+    
+    final_stats = service.notification_repo.get_stats()
+    service_stats = service.get_service_stats()
+    
+    logger.info("📊 FINAL SYSTEM SUMMARY:")
+    logger.info(f"   Total notifications processed: {final_stats['total_notifications']}")
+    logger.info(f"   Templates in system: {final_stats['total_templates']}")
+    logger.info(f"   User preferences set: {final_stats['total_preferences']}")
+    logger.info(f"   Channels registered: {service_stats['channels_registered']}")
+    logger.info(f"   Background processor active: {service_stats['background_thread_alive']}")
+    
+    logger.info(f"\n🧹 Shutting down services...")
+    service.shutdown()
+
+
+@pytest.fixture(scope="module")
+def users():
+    """Customer, seller and admin used across the flows"""
+    customer = Customer("customer_123", "john.doe@email.com", "John Doe")
+    seller = Seller("seller_456", "seller@amazon.com", "Amazon Seller", "Amazon Inc")
+    admin = Admin("admin_789", "admin@ecommerce.com", "System Admin")
+    return {'customer': customer, 'seller': seller, 'admin': admin}
+
+
+@pytest.fixture(scope="module")
+def customer(users):
+    return users['customer']
+
+
+@pytest.fixture(scope="module")
+def products(users):
+    """Catalogue listed by the seller"""
+    seller = users['seller']
+    
+    products = []
+    product_data = [
+        ("iPhone 15 Pro", 999.99, "Electronics", "Latest iPhone with A17 Pro chip"),
+        ("Samsung Galaxy S24", 899.99, "Electronics", "Flagship Android phone"),
+        ("MacBook Air M3", 1199.99, "Computers", "Apple's latest laptop")
+    ]
+    
+    for name, price, category, description in product_data:
+        product = Product.create(
+            name=name,
+            price=Money(price),
+            category=category,
+            seller_id=seller.user_id
+        )
+        # Set description after creation since it's handled specially
+        product.description = description
+        products.append(product)
+    return products
+
+
+@pytest.fixture(scope="module")
+def cart(users, products):
+    """Customer cart holding one of each product (two Samsungs)"""
+    customer = users['customer']
+    
+    cart = Cart.create_for_customer(customer.user_id)
+    cart.add_item(products[0].product_id, 1, products[0].price)  # iPhone
+    cart.add_item(products[1].product_id, 2, products[1].price)  # Samsung (qty: 2)
+    cart.add_item(products[2].product_id, 1, products[2].price)  # MacBook
+    return cart
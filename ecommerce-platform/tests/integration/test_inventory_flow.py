@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Inventory management flow with low stock alerts
+"""
+
+import logging
+
+from core.entities.notification import NotificationStatus
+
+logger = logging.getLogger(__name__)
+
+
+def test_6_inventory_management_flow(notification_service):
+    """Test 6: Inventory management with low stock alerts"""
+    logger.info("=" * 60)
+    logger.info("🧪 TEST 6: Inventory Management Flow")
+    logger.info("=" * 60)
+    
+    # Simulate low stock scenario
+    low_stock_products = [
+        {
+            'product_id': 'prod_001',
+            'warehouse_name': 'Mumbai Warehouse',
+            'available_quantity': 3,
+            'threshold': 10
+        },
+        {
+            'product_id': 'prod_002',
+            'warehouse_name': 'Delhi Warehouse', 
+            'available_quantity': 1,
+            'threshold': 10
+        },
+        {
+            'product_id': 'prod_003',
+            'warehouse_name': 'Bangalore Warehouse',
+            'available_quantity': 5,
+            'threshold': 10
+        }
+    ]
+    
+    logger.info(f"⚠️  Simulating low stock scenario:")
+    for product in low_stock_products:
+        logger.info(f"   - {product['product_id']}: {product['available_quantity']} remaining (threshold: {product['threshold']})")
+    
+    # Send low stock alert
+    notifications = notification_service.send_low_stock_alert(low_stock_products)
+    logger.info(f"\n📨 Sent {len(notifications)} low stock alert notifications")
+    assert notifications
+    
+    # Wait for notifications to process
+    assert notification_service.wait_until_idle(timeout=5)
+    assert not notification_service.notification_repo.find_pending_notifications()
+    assert all(n.status == NotificationStatus.SENT for n in notifications)
+    
+    logger.info("✅ Inventory management flow completed!\n")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Notification history flow
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def test_8_notification_history_flow(users, notification_service):
+    """Test 8: Notification history and tracking"""
+    logger.info("=" * 60)
+    logger.info("🧪 TEST 8: Notification History Flow")
+    logger.info("=" * 60)
+    
+    customer = users['customer']
+    
+    # Get notification history
+    logger.info(f"📚 Retrieving notification history for {customer.name}...")
+    notifications = notification_service.get_user_notifications(customer.user_id, limit=10)
+    
+    logger.info(f"📊 Found {len(notifications)} notifications in history")
+    
+    if notifications:
+        logger.info(f"\n📋 Recent notifications:")
+        for i, notif in enumerate(notifications[:5], 1):
+            status_emoji = "✅" if notif.status.value == "SENT" else "⏳" if notif.status.value == "PENDING" else "❌"
+            logger.info(f"   {i}. {status_emoji} {notif.notification_type.value} via {notif.channel.value}")
+            logger.info(f"      Subject: {notif.subject}")
+            logger.info(f"      Created: {notif.created_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            if notif.sent_at:
+                logger.info(f"      Sent: {notif.sent_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            logger.info("")
+    
+    # Get repository stats
+    repo_stats = notification_service.notification_repo.get_stats()
+    logger.info(f"📈 Repository Statistics:")
+    for key, value in repo_stats.items():
+        logger.info(f"   {key}: {value}")
+    
+    logger.info("✅ Notification history flow completed!\n")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Notification preference flow
+"""
+
+import sys
+import os
+import logging
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../src'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from datetime import datetime
+from types import SimpleNamespace
+
+from core.entities.notification import NotificationType, NotificationChannel, NotificationStatus
+from core.value_objects.money import Money
+
+
+logger = logging.getLogger(__name__)
+
+
+def test_7_notification_preferences_flow(users, notification_service):
+    """Test 7: User notification preferences"""
+    logger.info("=" * 60)
+    logger.info("🧪 TEST 7: Notification Preferences Flow")
+    logger.info("=" * 60)
+    
+    customer = users['customer']
+    now = datetime.now()
+    
+    # Set user preferences
+    logger.info(f"📋 Setting notification preferences for {customer.name}...")
+    
+    # Customer wants only email notifications for orders
+    order_preference = notification_service.update_user_preferences(
+        user_id=customer.user_id,
+        notification_type=NotificationType.ORDER_CONFIRMATION,
+        enabled_channels=[NotificationChannel.EMAIL],
+        is_enabled=True
+    )
+    
+    logger.info(f"✅ Order notifications: {list(order_preference.enabled_channel_values)}")
+    
+    # Customer disables payment notifications
+    payment_preference = notification_service.update_user_preferences(
+        user_id=customer.user_id,
+        notification_type=NotificationType.PAYMENT_SUCCESS,
+        enabled_channels=[],
+        is_enabled=False
+    )
+    
+    logger.info(f"🔕 Payment notifications: disabled")
+    
+    # Test sending notifications with preferences
+    logger.info(f"\n📨 Testing notifications with preferences...")
+    
+    # This should send email notification
+    mock_order = SimpleNamespace(
+        order_id='test_order_123',
+        customer_id=customer.user_id,
+        total_amount=Money(99.99),
+        items=['item1', 'item2'],
+        created_at=now
+    )
+    
+    order_notifications = notification_service.send_order_confirmation(mock_order, customer)
+    logger.info(f"📧 Order confirmation sent: {len(order_notifications)} notifications")
+    assert [n.channel for n in order_notifications] == [NotificationChannel.EMAIL]
+    
+    # This should send no notifications (disabled)
+    mock_payment = SimpleNamespace(
+        payment_id='test_payment_456',
+        customer_id=customer.user_id,
+        amount=Money(99.99),
+        method=SimpleNamespace(value='CREDIT_CARD'),
+        transaction_id='txn_test_456',
+        processed_at=now
+    )
+    
+    payment_notifications = notification_service.send_payment_success(mock_payment)
+    logger.info(f"💳 Payment success sent: {len(payment_notifications)} notifications (should be 0)")
+    assert payment_notifications == []
+    
+    # Wait for notifications to process
+    assert notification_service.wait_until_idle(timeout=5)
+    assert not notification_service.notification_repo.find_pending_notifications()
+    assert order_notifications[0].status == NotificationStatus.SENT
+    
+    logger.info("✅ Notification preferences flow completed!\n")
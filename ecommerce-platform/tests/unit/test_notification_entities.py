@@ -7,6 +7,7 @@ Tests the business logic and validation of notification entities
 
 import sys
 import os
+import logging
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../src'))
 
 from datetime import datetime
@@ -15,9 +16,13 @@ from core.entities.notification import (
     NotificationType, NotificationChannel, NotificationStatus, Priority
 )
 
+
+logger = logging.getLogger(__name__)
+
+
 def test_notification_template():
     """Test notification template business logic"""
-    print("🧪 Testing NotificationTemplate...")
+    logger.info("🧪 Testing NotificationTemplate...")
     
     # Test creating a template
     template = NotificationTemplate(
@@ -35,7 +40,7 @@ def test_notification_template():
     assert template.is_active == True
     assert 'order_id' in template.variables
     assert 'customer_name' in template.variables
-    print("   ✅ Template creation successful")
+    logger.info("   ✅ Template creation successful")
     
     # Test template rendering with valid variables
     variables = {
@@ -48,7 +53,27 @@ def test_notification_template():
     
     assert subject == "Order #ORD-123 Confirmed"
     assert body == "Dear John Doe, your order #ORD-123 is confirmed."
-    print("   ✅ Template rendering successful")
+    logger.info("   ✅ Template rendering successful")
+    
+    # Test format specs with nested fields render like str.format
+    padded = NotificationTemplate(
+        template_id="padded_template",
+        notification_type=NotificationType.ORDER_CONFIRMATION,
+        channel=NotificationChannel.EMAIL,
+        subject_template="Order #{order_id:>{width}}",
+        body_template="Total: {total:.{places}f}",
+        variables=['order_id', 'width', 'total', 'places']
+    )
+    padded_variables = {'order_id': 'ORD-123', 'width': 10, 'total': 42.5, 'places': 2}
+    
+    assert padded.render_subject(padded_variables) == "Order #{order_id:>{width}}".format(**padded_variables)
+    assert padded.render_body(padded_variables) == "Total: 42.50"
+    try:
+        padded.render_subject({'order_id': 'ORD-123'})
+        assert False, "Should have raised ValueError"
+    except ValueError as e:
+        assert "Missing template variable" in str(e)
+    logger.info("   ✅ Nested format spec rendering successful")
     
     # Test template validation with missing variables
     incomplete_variables = {'order_id': 'ORD-123'}  # Missing customer_name
@@ -56,7 +81,7 @@ def test_notification_template():
     missing = template.validate_variables(incomplete_variables)
     assert 'customer_name' in missing
     assert len(missing) == 1
-    print("   ✅ Template validation successful")
+    logger.info("   ✅ Template validation successful")
     
     # Test that rendering fails with missing variables
     try:
@@ -64,38 +89,43 @@ def test_notification_template():
         assert False, "Should have raised ValueError"
     except ValueError as e:
         assert "Missing template variable" in str(e)
-        print("   ✅ Missing variable validation successful")
+        logger.info("   ✅ Missing variable validation successful")
 
 
 def test_notification_preference():
     """Test notification preference business logic"""
-    print("🧪 Testing NotificationPreference...")
+    logger.info("🧪 Testing NotificationPreference...")
     
     # Test creating notification preferences
+    channels = [NotificationChannel.EMAIL, NotificationChannel.SMS]
     preference = NotificationPreference(
         user_id="user_123",
         notification_type=NotificationType.ORDER_CONFIRMATION,
-        enabled_channels=[NotificationChannel.EMAIL, NotificationChannel.SMS],
+        enabled_channels=channels,
         is_enabled=True
     )
+    # The caller's list is copied, so editing it cannot desync the channel lookups
+    channels.append(NotificationChannel.PUSH)
+    assert preference.enabled_channels == (NotificationChannel.EMAIL, NotificationChannel.SMS)
+    assert not preference.is_channel_enabled(NotificationChannel.PUSH)
     
     assert preference.user_id == "user_123"
     assert preference.notification_type == NotificationType.ORDER_CONFIRMATION
     assert NotificationChannel.EMAIL in preference.enabled_channels
     assert NotificationChannel.SMS in preference.enabled_channels
     assert preference.is_enabled == True
-    print("   ✅ Preference creation successful")
+    logger.info("   ✅ Preference creation successful")
     
     # Test checking if specific channel is enabled
     assert preference.is_channel_enabled(NotificationChannel.EMAIL) == True
     assert preference.is_channel_enabled(NotificationChannel.SLACK) == False
-    print("   ✅ Channel enabled check successful")
+    logger.info("   ✅ Channel enabled check successful")
     
     # Test that disabled preference blocks all channels
     preference.is_enabled = False
     assert preference.is_channel_enabled(NotificationChannel.EMAIL) == False
     assert preference.is_channel_enabled(NotificationChannel.SMS) == False
-    print("   ✅ Disabled preference validation successful")
+    logger.info("   ✅ Disabled preference validation successful")
     
     # Test quiet hours functionality
     preference_with_quiet = NotificationPreference(
@@ -113,12 +143,12 @@ def test_notification_preference():
     # Test time outside quiet hours (10:00)
     active_time = datetime.now().replace(hour=10, minute=0)
     assert preference_with_quiet.is_in_quiet_hours(active_time) == False
-    print("   ✅ Quiet hours functionality successful")
+    logger.info("   ✅ Quiet hours functionality successful")
 
 
 def test_notification():
     """Test notification entity business logic"""
-    print("🧪 Testing Notification...")
+    logger.info("🧪 Testing Notification...")
     
     # Test creating a notification
     notification = Notification.create(
@@ -139,7 +169,7 @@ def test_notification():
     assert notification.priority == Priority.HIGH
     assert notification.status == NotificationStatus.PENDING
     assert notification.retry_count == 0
-    print("   ✅ Notification creation successful")
+    logger.info("   ✅ Notification creation successful")
     
     # Test marking notification as sent
     provider_response = {"message_id": "msg_123", "status": "sent"}
@@ -148,7 +178,7 @@ def test_notification():
     assert notification.status == NotificationStatus.SENT
     assert notification.sent_at is not None
     assert notification.provider_response == provider_response
-    print("   ✅ Mark sent successful")
+    logger.info("   ✅ Mark sent successful")
     
     # Test marking notification as failed
     notification2 = Notification.create(
@@ -167,7 +197,7 @@ def test_notification():
     assert notification2.failed_at is not None
     assert notification2.error_message == error_message
     assert notification2.retry_count == 1
-    print("   ✅ Mark failed successful")
+    logger.info("   ✅ Mark failed successful")
     
     # Test retry logic for failed notifications
     notification3 = Notification.create(
@@ -190,7 +220,7 @@ def test_notification():
     # After max retries, cannot retry
     notification3.retry_count = notification3.max_retries
     assert notification3.can_retry() == False
-    print("   ✅ Retry logic successful")
+    logger.info("   ✅ Retry logic successful")
     
     # Test resetting notification for retry
     notification4 = Notification.create(
@@ -212,7 +242,7 @@ def test_notification():
     assert notification4.status == NotificationStatus.RETRY
     assert notification4.error_message is None
     assert notification4.provider_response is None
-    print("   ✅ Reset for retry successful")
+    logger.info("   ✅ Reset for retry successful")
     
     # Test reset for retry validation
     notification5 = Notification.create(
@@ -230,13 +260,13 @@ def test_notification():
         assert False, "Should have raised ValueError"
     except ValueError as e:
         assert "Notification cannot be retried" in str(e)
-        print("   ✅ Reset validation successful")
+        logger.info("   ✅ Reset validation successful")
 
 
 def run_all_tests():
     """Run all notification entity tests"""
-    print("🚀 Running Notification Entity Unit Tests")
-    print("=" * 60)
+    logger.info("🚀 Running Notification Entity Unit Tests")
+    logger.info("=" * 60)
     
     try:
         test_notification_template()
@@ -254,5 +284,6 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
     success = run_all_tests()
     sys.exit(0 if success else 1)
\ No newline at end of file
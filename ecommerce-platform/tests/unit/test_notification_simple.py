@@ -7,9 +7,11 @@ Tests core functionality without complex background processing
 
 import sys
 import os
+from datetime import timedelta
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../src'))
 
 from core.repositories.in_memory_notification_repository import InMemoryNotificationRepository
+from core.services.notification_service import NotificationService, EmailNotificationChannel
 from core.entities.notification import (
     Notification, NotificationTemplate, NotificationPreference,
     NotificationType, NotificationChannel, NotificationStatus, Priority
@@ -45,6 +47,21 @@ def test_notification_repository():
     assert user_notifications[0].user_id == "user_123"
     print("   ✅ User notifications query successful")
     
+    # A notification saved late but created earlier still sorts by created_at
+    older = Notification.create(
+        user_id="user_123",
+        notification_type=NotificationType.ORDER_SHIPPED,
+        channel=NotificationChannel.EMAIL,
+        subject="Older Subject",
+        body="Older Body",
+        recipient="test@example.com"
+    )
+    older.created_at = notification.created_at - timedelta(minutes=5)
+    repo.save_notification(older)
+    assert repo.find_user_notifications("user_123") == [notification, older]
+    assert repo.find_user_notifications("user_123", limit=1) == [notification]
+    print("   ✅ User notifications ordered by creation time")
+    
     # Test template management
     template = NotificationTemplate(
         template_id="test_template",
@@ -333,6 +350,54 @@ def test_notification_priority_and_filtering():
     print("   ✅ Filtering successful")
 
 
+def test_notification_queue_ties_and_failures():
+    """Test that the background queue handles equal keys and failing batch items"""
+    print("🧪 Testing Notification Queue...")
+    
+    class FailingRepository(InMemoryNotificationRepository):
+        """Repository that refuses to save one particular notification"""
+        failing_id = None
+        
+        def save_notification(self, notification):
+            if notification.notification_id == self.failing_id:
+                raise RuntimeError("storage unavailable")
+            return super().save_notification(notification)
+    
+    repo = FailingRepository()
+    service = NotificationService(repo)
+    service.register_channel(EmailNotificationChannel({'from_email': 'noreply@example.com'}))
+    
+    notifications = [
+        Notification.create(
+            user_id="user_123",
+            notification_type=NotificationType.LOW_STOCK_ALERT,
+            channel=NotificationChannel.EMAIL,
+            subject=f"Alert {i}",
+            body="Stock is low",
+            recipient="test@example.com"
+        )
+        for i in range(4)
+    ]
+    # Same priority and timestamp, so the queue must not fall back to comparing payloads
+    for notification in notifications:
+        notification.created_at = notifications[0].created_at
+    repo.failing_id = notifications[1].notification_id
+    
+    try:
+        service._queue_notification(notifications[0])
+        service._queue_notifications(notifications[1:])
+        assert service.wait_until_idle(timeout=5)
+    finally:
+        service.shutdown()
+    
+    # The failing notification must not stop the rest of its batch
+    sent = [n for n in notifications if n.status == NotificationStatus.SENT]
+    assert notifications[1] not in sent
+    assert len(sent) == 3
+    assert len(repo.find_user_notifications("user_123")) == 3
+    print("   ✅ Tied entries and failing batch items handled")
+
+
 def run_all_tests():
     """Run all simplified notification tests"""
     print("🚀 Running Simplified Notification Tests")
@@ -344,6 +409,7 @@ def run_all_tests():
         test_notification_preferences_logic()
         test_notification_lifecycle()
         test_notification_priority_and_filtering()
+        test_notification_queue_ties_and_failures()
         
         print("\n✅ All simplified notification tests passed!")
         return True
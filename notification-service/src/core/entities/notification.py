@@ -1,10 +1,16 @@
+import string
+import time
 import uuid
-from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from typing import Mapping, Optional
 
+from core.entities.slotted import SlottedEntity
 from core.entities.user import User
 
+_formatter = string.Formatter()
+_utcnow_ns = time.time_ns
+
 
 class NotificationChannelType(Enum):
     EMAIL = 0
@@ -23,57 +29,94 @@ class NotificationStatus(Enum):
     DELIVERED = 2
     FAILED = 3
 
-@dataclass
-class NotificationMessage:
-    template: str
-    type: NotificationMessageType = NotificationMessageType.MESSAGE
+class NotificationMessage(SlottedEntity):
+    __slots__ = ('template', 'type', '_compiled', '_has_placeholder')
+    _fields = ('template', 'type')
+
+    def __init__(self, template: str, type: NotificationMessageType = NotificationMessageType.MESSAGE):
+        self.template = template
+        self.type = type
+        self._compiled: Optional[list] = None
+        self._has_placeholder = _has_placeholder(template)
 
     def update_template(self, template: str):
         self.template = template
+        self._compiled = None
+        self._has_placeholder = _has_placeholder(template)
 
     def get_template(self):
         return self.template
 
-    def set_template_with_values(self, values: dict[str, str]) -> str:
+    def set_template_with_values(self, values: Mapping[str, str]) -> str:
         # fill template with values and return
-        return self.template.format(**values)
-
-
-
-@dataclass
-class Notification:
-    source: User
-    dest: User
-    channel: NotificationChannelType
-    message: NotificationMessage
-    status: NotificationStatus = field(default=NotificationStatus.PENDING)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: datetime = field(default_factory=lambda: datetime.now())
-    sent_at: datetime = None
-    last_retry_at: datetime = None
-    retry_count: int = 0
-    read_status: bool = False
-
-    def __post_init__(self):
-        if self.channel is None:
-            raise ValueError("channel cannot be None")
-
-        if self.message is None:
-            raise ValueError("message cannot be None")
-
-        if self.source is None:
-            raise ValueError("Source for notification cannot be empty")
-
-        if self.dest is None:
+        if not self._has_placeholder:
+            return self.template
+
+        if self._compiled is None:
+            self._compile()
+
+        parts = []
+        for literal_text, field_name, format_spec, conversion in self._compiled:
+            parts.append(literal_text)
+            if field_name is not None:
+                value = _formatter.get_field(field_name, (), values)[0]
+                if conversion:
+                    value = _formatter.convert_field(value, conversion)
+                # nested fields such as "{name:>{width}}" are filled in like str.format does
+                if "{" in format_spec:
+                    format_spec = format_spec.format_map(values)
+                parts.append(format(value, format_spec))
+        return "".join(parts)
+
+    def _compile(self):
+        # parse the template once into (literal, field, spec, conversion) segments
+        self._compiled = list(_formatter.parse(self.template))
+
+
+def _has_placeholder(template: str) -> bool:
+    # braces also cover "{{" / "}}" escapes, which still need formatting
+    return "{" in template or "}" in template
+
+
+class Notification(SlottedEntity):
+    __slots__ = ('source', 'dest', 'channel', 'message', 'status', 'id', 'created_at', 'sent_at',
+                 'last_retry_at', 'retry_count', 'read_status')
+    _fields = __slots__
+
+    def __init__(self, source: User, dest: User, channel: NotificationChannelType, message: NotificationMessage,
+                 status: NotificationStatus = NotificationStatus.PENDING, id: Optional[str] = None,
+                 created_at: Optional[int] = None, sent_at: Optional[int] = None,
+                 last_retry_at: Optional[int] = None, retry_count: int = 0, read_status: bool = False):
+        # single check on the common path; work out which field only when failing
+        if channel is None or message is None or source is None or dest is None:
+            if channel is None:
+                raise ValueError("channel cannot be None")
+            if message is None:
+                raise ValueError("message cannot be None")
+            if source is None:
+                raise ValueError("Source for notification cannot be empty")
             raise ValueError("Dest for notification cannot be empty")
 
+        self.source = source
+        self.dest = dest
+        self.channel = channel
+        self.message = message
+        self.status = status
+        self.id = uuid.uuid4().hex if id is None else id
+        # timestamps are epoch nanoseconds; use the *_dt properties for datetimes
+        self.created_at = _utcnow_ns() if created_at is None else created_at
+        self.sent_at = sent_at
+        self.last_retry_at = last_retry_at
+        self.retry_count = retry_count
+        self.read_status = read_status
+
     def update_channel(self, channel: NotificationChannelType):
         self.channel = channel
 
     def update_message(self, message: NotificationMessage):
         self.message = message
 
-    def get_formatted_message(self, values: dict[str, str]) -> str:
+    def get_formatted_message(self, values: Mapping[str, str]) -> str:
         return self.message.set_template_with_values(values)
 
     def update_notification_status(self, status: NotificationStatus):
@@ -88,9 +131,9 @@ class Notification:
     def update_status(self, status: NotificationStatus):
         self.status = status
         if self.status is NotificationStatus.SENT:
-            self.sent_at = datetime.now()
+            self.sent_at = _utcnow_ns()
 
-    def update_last_retry_at(self, last_retry_at: datetime):
+    def update_last_retry_at(self, last_retry_at: int):
         self.last_retry_at = last_retry_at
 
     def update_retry_count(self, retry_count: int):
@@ -102,4 +145,22 @@ class Notification:
 
     def is_read(self) -> bool:
         """Check if notification has been read"""
-        return self.read_status
\ No newline at end of file
+        return self.read_status
+
+    @property
+    def created_at_dt(self) -> datetime:
+        return _ns_to_datetime(self.created_at)
+
+    @property
+    def sent_at_dt(self) -> Optional[datetime]:
+        return _ns_to_datetime(self.sent_at)
+
+    @property
+    def last_retry_at_dt(self) -> Optional[datetime]:
+        return _ns_to_datetime(self.last_retry_at)
+
+
+def _ns_to_datetime(timestamp_ns: Optional[int]) -> Optional[datetime]:
+    if timestamp_ns is None:
+        return None
+    return datetime.fromtimestamp(timestamp_ns / 1e9)
@@ -1,47 +1,76 @@
-from dataclasses import dataclass, field
-
 from core.entities.notification import NotificationChannelType, NotificationMessageType
+from core.entities.slotted import FrozenSlottedEntity, SlottedEntity
 from core.entities.user import User
 
-@dataclass
-class NotificationChannelPreference:
-    priority: int = 0
-    channel_type: NotificationChannelType = NotificationChannelType.SMS
-    enabled: bool = True
-
-@dataclass
-class NotificationTypePreference:
-    priority: int = 0
-    message_type: NotificationMessageType = NotificationMessageType.MESSAGE
-    enabled: bool = True
-
-@dataclass
-class NotificationPreference:
-    user: User
-    channel_preference: list[NotificationChannelPreference] = None
-    type_preference: list[NotificationTypePreference] = None
-
-    def __post_init__(self):
-        if self.user is None:
+# preference entries are shared between instances, so they are frozen
+class NotificationChannelPreference(FrozenSlottedEntity):
+    __slots__ = ('priority', 'channel_type', 'enabled')
+    _fields = __slots__
+
+    def __init__(self, priority: int = 0, channel_type: NotificationChannelType = NotificationChannelType.SMS,
+                 enabled: bool = True):
+        object.__setattr__(self, 'priority', priority)
+        object.__setattr__(self, 'channel_type', channel_type)
+        object.__setattr__(self, 'enabled', enabled)
+
+class NotificationTypePreference(FrozenSlottedEntity):
+    __slots__ = ('priority', 'message_type', 'enabled')
+    _fields = __slots__
+
+    def __init__(self, priority: int = 0, message_type: NotificationMessageType = NotificationMessageType.MESSAGE,
+                 enabled: bool = True):
+        object.__setattr__(self, 'priority', priority)
+        object.__setattr__(self, 'message_type', message_type)
+        object.__setattr__(self, 'enabled', enabled)
+
+_DEFAULT_CHANNEL_PREFERENCES = (
+    NotificationChannelPreference(0, NotificationChannelType.SMS, True),
+    NotificationChannelPreference(0, NotificationChannelType.EMAIL, True),
+    NotificationChannelPreference(0, NotificationChannelType.PUSH, True),
+)
+
+_DEFAULT_TYPE_PREFERENCES = (
+    NotificationTypePreference(0, NotificationMessageType.MESSAGE, True),
+    NotificationTypePreference(0, NotificationMessageType.FRIEND_REQUEST, True),
+    NotificationTypePreference(0, NotificationMessageType.LIKE, True),
+    NotificationTypePreference(0, NotificationMessageType.COMMENT, True),
+)
+
+class NotificationPreference(SlottedEntity):
+    # type_enabled_mask and channels_enabled are derived lookups, rebuilt whenever a preference list is replaced
+    __slots__ = ('user', 'channel_preference', 'type_preference', 'type_enabled_mask', 'channels_enabled')
+    _fields = ('user', 'channel_preference', 'type_preference')
+
+    def __init__(self, user: User, channel_preference: list[NotificationChannelPreference] = None,
+                 type_preference: list[NotificationTypePreference] = None):
+        if user is None:
             raise ValueError("user is required")
 
-        if self.channel_preference is None:
-            self.channel_preference = [
-            NotificationChannelPreference(0, NotificationChannelType.SMS, True),
-            NotificationChannelPreference(0, NotificationChannelType.EMAIL, True),
-            NotificationChannelPreference(0, NotificationChannelType.PUSH, True),
-        ]
-
-        if self.type_preference is None:
-            self.type_preference = [
-                NotificationTypePreference(0, NotificationMessageType.MESSAGE, True),
-                NotificationTypePreference(0, NotificationMessageType.FRIEND_REQUEST, True),
-                NotificationTypePreference(0, NotificationMessageType.LIKE, True),
-                NotificationTypePreference(0, NotificationMessageType.COMMENT, True),
-            ]
+        self.user = user
+        self.channel_preference = list(_DEFAULT_CHANNEL_PREFERENCES) if channel_preference is None else channel_preference
+        self.type_preference = list(_DEFAULT_TYPE_PREFERENCES) if type_preference is None else type_preference
+
+        self._index_channels()
+        self._index_types()
 
     def update_channel_preference(self, channel_preference: list[NotificationChannelPreference]):
         self.channel_preference = channel_preference
+        self._index_channels()
 
     def update_type_preference(self, type_preference: list[NotificationTypePreference]):
-        self.type_preference = type_preference
\ No newline at end of file
+        self.type_preference = type_preference
+        self._index_types()
+
+    def is_type_enabled(self, message_type: NotificationMessageType) -> bool:
+        return (self.type_enabled_mask >> message_type.value) & 1 == 1
+
+    def _index_channels(self):
+        self.channels_enabled = [pref.channel_type for pref in self.channel_preference if pref.enabled]
+
+    def _index_types(self):
+        # bit k is set when NotificationMessageType with value k is enabled
+        mask = 0
+        for pref in self.type_preference:
+            if pref.enabled:
+                mask |= 1 << pref.message_type.value
+        self.type_enabled_mask = mask
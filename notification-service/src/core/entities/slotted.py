@@ -0,0 +1,36 @@
+from dataclasses import FrozenInstanceError
+
+
+class SlottedEntity:
+    """Base for entities that declare __slots__ by hand (dataclass(slots=True) needs Python 3.10).
+
+    Subclasses list the attributes that take part in repr and equality in _fields.
+    """
+    __slots__ = ()
+    _fields: tuple = ()
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __repr__(self):
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__qualname__}({args})"
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._values() == other._values()
+
+
+class FrozenSlottedEntity(SlottedEntity):
+    """Immutable, hashable variant; __init__ must assign through object.__setattr__."""
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __hash__(self):
+        return hash(self._values())
@@ -1,25 +1,24 @@
 import uuid
-from dataclasses import dataclass
 
+from core.entities.slotted import SlottedEntity
 
-@dataclass
-class User:
-    name: str
-    email: str
-    phone_no: str = None
-    device_id: str = None
-    id: str = None
 
-    def __post_init__(self):
-        if self.id is None:
-            self.id = str(uuid.uuid4())
+class User(SlottedEntity):
+    __slots__ = ('name', 'email', 'phone_no', 'device_id', 'id')
+    _fields = __slots__
 
-        if self.name is None:
-            raise ValueError("Name cannot be None")
-
-        if self.email is None:
+    def __init__(self, name: str, email: str, phone_no: str = None, device_id: str = None, id: str = None):
+        if name is None or email is None:
+            if name is None:
+                raise ValueError("Name cannot be None")
             raise ValueError("Email cannot be None")
 
+        self.name = name
+        self.email = email
+        self.phone_no = phone_no
+        self.device_id = device_id
+        self.id = uuid.uuid4().hex if id is None else id
+
     def update_name(self, name: str):
         self.name = name
 
@@ -1,4 +1,5 @@
-from typing import Dict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
 from core.entities.notification import NotificationChannelType
 from core.interfaces.notification_sender import NotificationSender
 from core.services.sender.email_sender import EmailSender
@@ -11,13 +12,17 @@ class NotificationSenderFactory:
 
     def __init__(self):
         self._senders: Dict[NotificationChannelType, NotificationSender] = {}
+        # channel values are dense from 0, so dispatch indexes a list mirror of _senders
+        self._senders_arr: List[Optional[NotificationSender]] = [None] * len(NotificationChannelType)
         self._initialize_senders()
+        # live read-only view, so registered senders show up without copying
+        self._senders_view = MappingProxyType(self._senders)
 
     def _initialize_senders(self):
         """Initialize all available notification senders"""
-        self._senders[NotificationChannelType.EMAIL] = EmailSender()
-        self._senders[NotificationChannelType.SMS] = SMSSender()
-        self._senders[NotificationChannelType.PUSH] = PushSender()
+        self.register_sender(NotificationChannelType.EMAIL, EmailSender())
+        self.register_sender(NotificationChannelType.SMS, SMSSender())
+        self.register_sender(NotificationChannelType.PUSH, PushSender())
 
     def get_sender(self, channel_type: NotificationChannelType) -> NotificationSender:
         """
@@ -32,15 +37,17 @@ class NotificationSenderFactory:
         Raises:
             ValueError: If channel type is not supported
         """
-        if channel_type not in self._senders:
+        # only real channels may index the list; other enums share its int values
+        sender = self._senders_arr[channel_type.value] if isinstance(channel_type, NotificationChannelType) else None
+        if sender is None:
             raise ValueError(f"Unsupported notification channel: {channel_type}")
+        return sender
 
-        return self._senders[channel_type]
-
-    def get_all_senders(self) -> Dict[NotificationChannelType, NotificationSender]:
-        """Get all available notification senders"""
-        return self._senders.copy()
+    def get_all_senders(self) -> Mapping[NotificationChannelType, NotificationSender]:
+        """Get a read-only view of all available notification senders"""
+        return self._senders_view
 
     def register_sender(self, channel_type: NotificationChannelType, sender: NotificationSender):
         """Register a new notification sender (for extensibility)"""
-        self._senders[channel_type] = sender
\ No newline at end of file
+        self._senders[channel_type] = sender
+        self._senders_arr[channel_type.value] = sender
\ No newline at end of file
@@ -1,4 +1,7 @@
+import asyncio
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import List, Optional
 from core.entities.notification import Notification
 
 
@@ -18,6 +21,38 @@ class NotificationSender(ABC):
         """
         pass
 
+    def send_many(self, notifications: List[Notification]) -> List[bool]:
+        """
+        Send a batch of notifications through this channel
+
+        Senders that can talk to their transport in bulk should override this;
+        the default sends them one at a time.
+
+        Args:
+            notifications: The notifications to send
+
+        Returns:
+            List[bool]: Result of each send, in the same order
+        """
+        return [self.send(notification) for notification in notifications]
+
+    async def send_many_async(self, notifications: List[Notification],
+                              executor: Optional[Executor] = None) -> List[bool]:
+        """
+        Send a batch of notifications without blocking the event loop
+
+        Senders with a non-blocking transport should override this; the default
+        runs send_many on the given executor, or the loop's default one when omitted.
+
+        Args:
+            notifications: The notifications to send
+            executor: Pool to run the blocking send_many on; None uses the loop's default executor
+
+        Returns:
+            List[bool]: Result of each send, in the same order
+        """
+        return await asyncio.get_running_loop().run_in_executor(executor, self.send_many, notifications)
+
     @abstractmethod
     def get_channel_type(self) -> str:
         """Return the channel type this sender handles"""
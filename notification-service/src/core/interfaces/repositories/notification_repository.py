@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
 from core.entities.notification import Notification
 from core.entities.user import User
@@ -9,10 +10,14 @@ class NotificationRepository(ABC):
     def save(self, notification: Notification):
         pass
 
+    @abstractmethod
+    def save_many(self, notifications: List[Notification]):
+        pass
+
     @abstractmethod
     def delete(self, notification: Notification):
         pass
 
     @abstractmethod
-    def get_notifications_for_user_by_id(self, user_id: str):
-        pass
\ No newline at end of file
+    def get_notifications_for_user_by_id(self, user_id: str, limit: Optional[int] = None, offset: int = 0):
+        pass
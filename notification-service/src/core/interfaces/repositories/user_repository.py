@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
 
 from core.entities.user import User
 
@@ -15,6 +16,10 @@ class UserRepository(ABC):
     def find_by_id(self, id: str):
         pass
 
+    @abstractmethod
+    def find_by_ids(self, ids: List[str]) -> Dict[str, Optional[User]]:
+        pass
+
     @abstractmethod
     def find_by_email(self, email: str):
         pass
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Optional
 
 from core.entities.notification_preference import NotificationPreference
 from core.interfaces.repositories.notification_preference_repository import NotificationPreferenceRepository
@@ -6,17 +6,18 @@ from core.interfaces.repositories.notification_preference_repository import Noti
 
 class InMemoryNotificationPreferenceRepository(NotificationPreferenceRepository):
     def __init__(self):
-        self.notification_preferences: list[NotificationPreference] = []
+        # Saved preferences per user, oldest first; lookups return the first one saved
+        self._by_user_id: Dict[str, List[NotificationPreference]] = {}
 
     def save(self, notification_preference: NotificationPreference):
-        self.notification_preferences.append(notification_preference)
+        self._by_user_id.setdefault(notification_preference.user.id, []).append(notification_preference)
 
     def delete(self, notification_preference: NotificationPreference):
-        self.notification_preferences.remove(notification_preference)
+        self._by_user_id[notification_preference.user.id].remove(notification_preference)
 
     def get_notification_preference_for_user_by_id(self, user_id: str) -> Optional[NotificationPreference]:
-        for notification_preference in self.notification_preferences:
-            if notification_preference.user.id == user_id:
-                return notification_preference
+        notification_preferences = self._by_user_id.get(user_id)
+        if notification_preferences:
+            return notification_preferences[0]
 
-        return None
\ No newline at end of file
+        return None
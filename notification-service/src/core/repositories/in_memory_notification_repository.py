@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Optional
 
 from core.entities.notification import Notification
 from core.interfaces.repositories.notification_repository import NotificationRepository
@@ -6,18 +6,39 @@ from core.interfaces.repositories.notification_repository import NotificationRep
 
 class InMemoryNotificationRepository(NotificationRepository):
     def __init__(self):
-        self.notifications: list[Notification] = []
+        self._by_id: Dict[str, Notification] = {}
+        self._by_user: Dict[str, List[Notification]] = {}
 
     def save(self, notification: Notification):
-        self.notifications.append(notification)
+        existing = self._by_id.get(notification.id)
+        if existing is notification:
+            return
+
+        self._by_id[notification.id] = notification
+        if existing is not None and existing.source.id == notification.source.id:
+            # replacement object for a stored id: keep its position in the history
+            user_notifications = self._by_user[existing.source.id]
+            user_notifications[user_notifications.index(existing)] = notification
+            return
+
+        if existing is not None:
+            self._by_user[existing.source.id].remove(existing)
+        self._by_user.setdefault(notification.source.id, []).append(notification)
+
+    def save_many(self, notifications: List[Notification]):
+        for notification in notifications:
+            self.save(notification)
 
     def delete(self, notification: Notification):
-        self.notifications.remove(notification)
+        self._by_id.pop(notification.id)
+        self._by_user[notification.source.id].remove(notification)
 
-    def get_notifications_for_user_by_id(self, user_id: str) -> List[Notification]:
-        res = []
-        for notification in self.notifications:
-            if notification.source.id == user_id:
-                res.append(notification)
+    def get_notifications_for_user_by_id(self, user_id: str, limit: Optional[int] = None,
+                                         offset: int = 0) -> List[Notification]:
+        # per-user lists are in save order, so a page is a single slice
+        user_notifications = self._by_user.get(user_id)
+        if not user_notifications:
+            return []
 
-        return res
\ No newline at end of file
+        end = None if limit is None else offset + limit
+        return user_notifications[offset:end]
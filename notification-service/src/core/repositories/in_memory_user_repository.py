@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Optional
 
 from core.entities.user import User
 from core.interfaces.repositories.user_repository import UserRepository
@@ -6,27 +6,37 @@ from core.interfaces.repositories.user_repository import UserRepository
 
 class InMemoryUserRepository(UserRepository):
     def __init__(self):
-        self.users = []
+        self._by_id: Dict[str, User] = {}
+        self._by_email: Dict[str, User] = {}
 
     def add(self, user: User):
-        self.users.append(user)
+        self._by_id[user.id] = user
+        self._by_email[user.email] = user
 
     def remove(self, user: User):
-        self.users.remove(user)
+        del self._by_id[user.id]
+        if self._by_email.get(user.email) is user:
+            del self._by_email[user.email]
 
     def find_by_id(self, id: str) -> Optional[User]:
-        for user in self.users:
-            if user.id == id:
-                return user
+        return self._by_id.get(id)
 
-        return None
+    def find_by_ids(self, ids: List[str]) -> Dict[str, Optional[User]]:
+        by_id = self._by_id
+        return {id: by_id.get(id) for id in ids}
 
     def find_by_email(self, email: str) -> Optional[User]:
-        for user in self.users:
+        user = self._by_email.get(email)
+        if user is not None and user.email == email:
+            return user
+
+        # Email may have changed through User.update_email; fall back to a scan and re-index
+        for user in self._by_id.values():
             if user.email == email:
+                self._by_email[email] = user
                 return user
 
         return None
 
     def get_all(self):
-        return self.users
+        return list(self._by_id.values())
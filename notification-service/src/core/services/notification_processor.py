@@ -1,10 +1,15 @@
+import asyncio
 import time
 import logging
-from datetime import datetime
-from core.entities.notification import Notification, NotificationStatus
+from collections import defaultdict
+from concurrent.futures import Executor
+from typing import Dict, List, Mapping, Optional
+from core.entities.notification import Notification, NotificationChannelType, NotificationStatus
 from core.interfaces.notification_sender import NotificationSender
 from core.interfaces.repositories.notification_repository import NotificationRepository
 
+_utcnow_ns = time.time_ns
+
 
 class NotificationProcessor:
     """Handles notification processing with retry logic and exponential backoff"""
@@ -14,68 +19,106 @@ class NotificationProcessor:
         self.logger = logging.getLogger(__name__)
         self.max_retries = 3
         self.base_delay = 1  # Base delay in seconds
+        # exponential backoff delay per retry count
+        self._delays = tuple(self.base_delay * (1 << i) for i in range(self.max_retries + 1))
 
-    def process_notification(self, notification: Notification, sender: NotificationSender) -> bool:
+    async def process_batch(self, notifications: List[Notification],
+                            senders: Mapping[NotificationChannelType, NotificationSender],
+                            executor: Optional[Executor] = None) -> List[bool]:
+        """
+        Process notifications grouped by channel, one sender call per attempt
+
+        Each channel's group is sent with the sender's send_many_async; the ones
+        that fail are retried together after a single backoff. Channels run
+        concurrently and the whole batch is saved once every channel has finished.
+
+        Args:
+            notifications: The notifications to process
+            senders: Sender for each channel, e.g. NotificationSenderFactory.get_all_senders()
+            executor: Pool for blocking sends; the loop's default executor when omitted
+
+        Returns:
+            List[bool]: True for each notification that was sent, in order
+        """
+        by_channel: Dict[NotificationChannelType, List[Notification]] = defaultdict(list)
+        for notification in notifications:
+            by_channel[notification.channel].append(notification)
+
+        channel_senders = []
+        for channel, batch in by_channel.items():
+            sender = senders.get(channel)
+            if sender is None:
+                raise ValueError(f"Unsupported notification channel: {channel}")
+            channel_senders.append((batch, sender))
+
+        await asyncio.gather(
+            *(self._process_channel_batch(batch, sender, executor) for batch, sender in channel_senders)
+        )
+        # every notification is now SENT or FAILED, so persist them in one call
+        self.notification_repository.save_many(notifications)
+        return [notification.status is NotificationStatus.SENT for notification in notifications]
+
+    async def process_notification(self, notification: Notification, sender: NotificationSender,
+                                   executor: Optional[Executor] = None) -> bool:
         """
         Process a notification with retry logic
 
         Args:
             notification: The notification to process
             sender: The notification sender to use
+            executor: Pool for the blocking send; the loop's default executor when omitted
 
         Returns:
             bool: True if successfully sent, False if failed after all retries
         """
-        retry_count = 0
-
-        while retry_count <= self.max_retries:
-            try:
-                # Update notification retry info
+        await self._process_channel_batch([notification], sender, executor)
+        self.notification_repository.save(notification)
+        return notification.status is NotificationStatus.SENT
+
+    async def _process_channel_batch(self, notifications: List[Notification], sender: NotificationSender,
+                                     executor: Optional[Executor]):
+        """Send one channel's notifications with retry logic, leaving them in a terminal state"""
+        pending = notifications
+
+        for retry_count in range(self.max_retries + 1):
+            attempted_at = _utcnow_ns()
+            for notification in pending:
                 notification.retry_count = retry_count
-                notification.last_retry_at = datetime.now()
-
+                notification.last_retry_at = attempted_at
                 if retry_count > 0:
                     notification.status = NotificationStatus.PENDING
-                    self.logger.info(f"Retrying notification {notification.id}, attempt {retry_count}")
 
-                # Attempt to send the notification
-                success = sender.send(notification)
+            if retry_count > 0:
+                self.logger.info(f"Retrying {len(pending)} {sender.get_channel_type()} notifications, attempt {retry_count}")
+
+            # Attempt to send the batch; an exception fails every notification in it
+            try:
+                results = await sender.send_many_async(pending, executor)
+            except Exception as e:
+                self.logger.error(f"Error processing {sender.get_channel_type()} batch: {str(e)}")
+                results = [False] * len(pending)
 
+            sent_at = _utcnow_ns()
+            failed = []
+            for notification, success in zip(pending, results):
                 if success:
                     notification.status = NotificationStatus.SENT
-                    notification.sent_at = datetime.now()
-                    self.notification_repository.save(notification)
-                    self.logger.info(f"Notification {notification.id} sent successfully")
-                    return True
+                    notification.sent_at = sent_at
                 else:
-                    # Send failed, prepare for retry
                     notification.status = NotificationStatus.FAILED
-                    self.notification_repository.save(notification)
-
-                    if retry_count < self.max_retries:
-                        # Calculate exponential backoff delay
-                        delay = self.base_delay * (2 ** retry_count)
-                        self.logger.warning(f"Notification {notification.id} failed, retrying in {delay} seconds")
-                        time.sleep(delay)
-                    else:
-                        self.logger.error(f"Notification {notification.id} failed after {self.max_retries} retries")
-                        return False
+                    failed.append(notification)
 
-            except Exception as e:
-                self.logger.error(f"Error processing notification {notification.id}: {str(e)}")
-                notification.status = NotificationStatus.FAILED
-                self.notification_repository.save(notification)
-
-                if retry_count < self.max_retries:
-                    delay = self.base_delay * (2 ** retry_count)
-                    self.logger.warning(f"Retrying notification {notification.id} in {delay} seconds due to error")
-                    time.sleep(delay)
-                else:
-                    return False
+            self.logger.info(f"{len(pending) - len(failed)} {sender.get_channel_type()} notifications sent successfully")
+            if not failed or retry_count == self.max_retries:
+                break
 
-            retry_count += 1
+            pending = failed
+            delay = self._delays[retry_count]
+            self.logger.warning(f"{len(pending)} {sender.get_channel_type()} notifications failed, retrying in {delay} seconds")
+            await asyncio.sleep(delay)
 
-        return False
+        if failed:
+            self.logger.error(f"{len(failed)} {sender.get_channel_type()} notifications failed after {self.max_retries} retries")
 
     def should_retry(self, notification: Notification) -> bool:
         """Check if a notification should be retried"""
@@ -87,8 +130,8 @@ class NotificationProcessor:
 
         # Check if enough time has passed since last retry
         if notification.last_retry_at:
-            min_retry_interval = self.base_delay * (2 ** notification.retry_count)
-            time_since_retry = (datetime.now() - notification.last_retry_at).total_seconds()
+            min_retry_interval = self._delays[notification.retry_count]
+            time_since_retry = (_utcnow_ns() - notification.last_retry_at) / 1e9
             return time_since_retry >= min_retry_interval
 
         return True
\ No newline at end of file
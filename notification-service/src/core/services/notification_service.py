@@ -1,4 +1,6 @@
-from typing import List
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
 
 from core.entities.notification import NotificationMessageType, Notification, NotificationMessage, NotificationStatus
 from core.factories.notification_sender_factory import NotificationSenderFactory
@@ -19,11 +21,24 @@ class NotificationService:
         self.notification_repository = notification_repository
         self.rate_limiter = rate_limiter
         self.notification_processor = notification_processor
+        # live read-only channel -> sender view, resolved once
+        self._senders = notification_sender_factory.get_all_senders()
+        # shared pool so channel sends overlap without spawning threads per call
+        self._pool = ThreadPoolExecutor(max_workers=8)
 
+    def close(self):
+        """Wait for in-flight sends and release the sender thread pool"""
+        self._pool.shutdown(wait=True)
 
     def send_notification(self, user_id: str, receiver_id: str, type: NotificationMessageType, body: str):
-        source_user = self.user_service.get_user_by_id(user_id)
-        destination_user = self.user_service.get_user_by_id(receiver_id)
+        asyncio.run(self.send_notification_async(user_id, receiver_id, type, body))
+
+    async def send_notification_async(self, user_id: str, receiver_id: str, type: NotificationMessageType, body: str):
+        if user_id == receiver_id:
+            source_user = destination_user = self.user_service.get_user_by_id(user_id)
+        else:
+            users = self.user_service.get_users_by_ids([user_id, receiver_id])
+            source_user, destination_user = users[user_id], users[receiver_id]
 
         if not self.rate_limiter.can_send(user_id):
             raise Exception(f"Rate limit exceeded for user {user_id}")
@@ -32,31 +47,61 @@ class NotificationService:
         if notification_preference is None:
             return
 
-        type_enabled = False
-        for notification_type in notification_preference.type_preference:
-            if notification_type.message_type == type and notification_type.enabled:
-                type_enabled = True
-                break
+        if not notification_preference.is_type_enabled(type):
+            return
 
-        if not type_enabled:
+        notifications = [
+            Notification(
+                source=source_user,
+                dest=destination_user,
+                channel=channel_type,
+                message=NotificationMessage(type=type, template=body)
+            )
+            for channel_type in notification_preference.channels_enabled
+        ]
+
+        # Process all channels with retry logic; the processor persists the
+        # batch once every notification reaches a terminal state
+        if notifications:
+            await self.notification_processor.process_batch(notifications, self._senders, self._pool)
+
+    def send_many(self, user_id: str, messages: List[Tuple[str, NotificationMessageType, str]]):
+        asyncio.run(self.send_many_async(user_id, messages))
+
+    async def send_many_async(self, user_id: str, messages: List[Tuple[str, NotificationMessageType, str]]):
+        """Send (receiver_id, type, body) messages from one user, charging the rate limit once"""
+        if not messages:
             return
 
-        for channel_pref in notification_preference.channel_preference:
-            if channel_pref.enabled:
-                # Create notification with proper channel type
-                notification = Notification(
-                    source=source_user,
-                    dest=destination_user,
-                    channel=channel_pref.channel_type,  # ← Use channel_type, not the preference object
-                    message=NotificationMessage(type=type, template=body)
-                )
+        notification_preference = self.user_service.get_notification_preference_for_user(user_id)
+        if notification_preference is None:
+            return
+
+        user_ids = list(dict.fromkeys([user_id, *(receiver_id for receiver_id, _, _ in messages)]))
+        users = self.user_service.get_users_by_ids(user_ids)
+        unknown = [id for id in user_ids if users.get(id) is None]
+        if unknown:
+            raise ValueError(f"Unknown users: {', '.join(unknown)}")
+        source_user = users[user_id]
 
-                # Get appropriate sender and process with retry logic
-                sender = self.notification_sender_factory.get_sender(channel_pref.channel_type)
-                success = self.notification_processor.process_notification(notification, sender)
+        # charge only once the batch is known to be deliverable
+        if not self.rate_limiter.can_send_n(user_id, len(messages)):
+            raise Exception(f"Rate limit exceeded for user {user_id}")
 
-                if success:
-                    self.notification_repository.save(notification)
+        notifications = [
+            Notification(
+                source=source_user,
+                dest=users[receiver_id],
+                channel=channel_type,
+                message=NotificationMessage(type=type, template=body)
+            )
+            for receiver_id, type, body in messages
+            if notification_preference.is_type_enabled(type)
+            for channel_type in notification_preference.channels_enabled
+        ]
+
+        if notifications:
+            await self.notification_processor.process_batch(notifications, self._senders, self._pool)
 
     def get_notifications_sent_by_user(self, user_id: str) -> List[Notification]:
         return self.notification_repository.get_notifications_for_user_by_id(user_id)
@@ -64,7 +109,7 @@ class NotificationService:
 
     def get_notification_history(self, user_id: str, limit: int = 50) -> List[Notification]:
         """Get notification history for a user"""
-        return self.notification_repository.get_notifications_for_user_by_id(user_id)[:limit]
+        return self.notification_repository.get_notifications_for_user_by_id(user_id, limit=limit)
 
     def mark_as_read(self, user_id: str, notification_id: str):
         """Mark a notification as read"""
@@ -1,4 +1,5 @@
 import logging
+from typing import List
 from core.entities.notification import Notification, NotificationChannelType
 from core.interfaces.notification_sender import NotificationSender
 
@@ -7,10 +8,25 @@ logger = logging.getLogger(__name__)
 class PushSender(NotificationSender):
     """Email notification sender implementation"""
 
-    def __init__(self):
-        pass
+    def __init__(self, batch_size: int = 64):
+        # notifications pushed over one connection before opening the next
+        self.batch_size = batch_size
 
     def send(self, notification: Notification) -> bool:
+        return self.send_many([notification])[0]
+
+    def send_many(self, notifications: List[Notification]) -> List[bool]:
+        results = []
+        for start in range(0, len(notifications), self.batch_size):
+            results.extend(self._send_batch(notifications[start:start + self.batch_size]))
+        return results
+
+    def _send_batch(self, notifications: List[Notification]) -> List[bool]:
+        # Simulate one persistent connection per batch (in real world: an HTTP/2 stream to APNs/FCM)
+        logger.info("Opening push connection for %s notifications", len(notifications))
+        return [self._push(notification) for notification in notifications]
+
+    def _push(self, notification: Notification) -> bool:
         try:
             # Get recipient email
             recipient_device_id = notification.dest.device_id
@@ -18,15 +34,15 @@ class PushSender(NotificationSender):
             body = notification.get_formatted_message({})
 
             # Simulate email sending (in real world: SendGrid, SES, etc.)
-            logger.info(f"Sending email to {recipient_device_id}")
-            logger.info(f"Subject: {subject}, Body: {body}")
+            logger.info("Sending email to %s", recipient_device_id)
+            logger.info("Subject: %s, Body: %s", subject, body)
 
 
-            logger.info(f"Email sent successfully to {recipient_device_id}")
+            logger.info("Email sent successfully to %s", recipient_device_id)
             return True
 
         except Exception as e:
-            logger.error(f"Error sending email: {str(e)}")
+            logger.error("Error sending email: %s", e)
             return False
 
     def get_channel_type(self) -> str:
@@ -1,24 +1,67 @@
 import time
-from collections import defaultdict, deque
-from typing import Dict, Deque
+from collections import OrderedDict
+from typing import List, Tuple
 import threading
 
+_SHARD_COUNT = 16  # must be a power of two
+
+# window_id << 64 | current window count << 32 | previous window count, packed
+# into one int so each update stores a single object
+_WindowCounts = int
+_COUNT_BITS = 32
+_COUNT_MASK = (1 << _COUNT_BITS) - 1
+
+
+def _pack(window_id: int, current: int, previous: int) -> _WindowCounts:
+    return (window_id << (2 * _COUNT_BITS)) | (current << _COUNT_BITS) | previous
+
 
 class RateLimiter:
-    """Rate limiter implementation using sliding window approach"""
+    """Rate limiter implementation using a sliding window counter
 
-    def __init__(self, max_requests: int = 10, time_window: int = 60):
+    Each user keeps request counts for the current and previous fixed window;
+    the previous count is weighted by how much of it still overlaps the
+    sliding window. Per-user state is spread over lock-striped shards so
+    unrelated users do not contend, and each shard keeps only its most
+    recently active users; an evicted user starts again with a full quota.
+    """
+
+    def __init__(self, max_requests: int = 10, time_window: int = 60, max_users: int = 100_000):
         """
         Initialize rate limiter
 
         Args:
             max_requests: Maximum number of requests allowed (default: 10)
             time_window: Time window in seconds (default: 60 = 1 minute)
+            max_users: Approximate number of users tracked before evicting the least recent
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self._user_requests: Dict[str, Deque[float]] = defaultdict(deque)
-        self._lock = threading.Lock()
+        self.time_window_ns = int(time_window * 1_000_000_000)
+        # weighted counts are kept scaled by time_window_ns so checks stay in integers
+        self._scaled_limit = max_requests * self.time_window_ns
+        self._max_users_per_shard = max(1, max_users // _SHARD_COUNT)
+        self._shards: List[Tuple[threading.Lock, "OrderedDict[str, _WindowCounts]"]] = [
+            (threading.Lock(), OrderedDict()) for _ in range(_SHARD_COUNT)
+        ]
+
+    def _shard(self, user_id: str) -> Tuple[threading.Lock, "OrderedDict[str, _WindowCounts]"]:
+        return self._shards[hash(user_id) & (_SHARD_COUNT - 1)]
+
+    def _current_counts(self, counts: _WindowCounts, window_id: int) -> Tuple[int, int]:
+        """Private method to roll stored counts forward to window_id"""
+        stored_window_id = counts >> (2 * _COUNT_BITS)
+        current = (counts >> _COUNT_BITS) & _COUNT_MASK
+        if stored_window_id == window_id:
+            return current, counts & _COUNT_MASK
+        if stored_window_id == window_id - 1:
+            return 0, current
+        return 0, 0
+
+    def _scaled_count(self, current: int, previous: int, now_ns: int) -> int:
+        """Private method to estimate requests in the sliding window ending now, times time_window_ns"""
+        remaining_ns = self.time_window_ns - now_ns % self.time_window_ns
+        return previous * remaining_ns + current * self.time_window_ns
 
     def can_send(self, user_id: str) -> bool:
         """
@@ -30,46 +73,67 @@ class RateLimiter:
         Returns:
             bool: True if user can send, False if rate limited
         """
-        with self._lock:
-            current_time = time.time()
-            user_requests = self._user_requests[user_id]
+        return self.can_send_n(user_id, 1)
+
+    def can_send_n(self, user_id: str, n: int) -> bool:
+        """
+        Check if user can send n notifications at once, charging all of them or none
 
-            # Remove old requests outside the time window
-            while user_requests and current_time - user_requests[0] > self.time_window:
-                user_requests.popleft()
+        Args:
+            user_id: The user ID to check
+            n: Number of notifications to charge
+
+        Returns:
+            bool: True if all n can be sent, False if that would exceed the rate limit
 
-            # Check if user has exceeded the limit
-            if len(user_requests) >= self.max_requests:
+        Raises:
+            ValueError: If n is less than 1
+        """
+        if n < 1:
+            raise ValueError(f"Number of notifications must be at least 1, got {n}")
+
+        lock, states = self._shard(user_id)
+        with lock:
+            now_ns = time.monotonic_ns()
+            window_id = now_ns // self.time_window_ns
+            current, previous = self._current_counts(states.get(user_id, _pack(window_id, 0, 0)), window_id)
+
+            # Check if the last of the n requests would exceed the limit
+            if self._scaled_count(current + n - 1, previous, now_ns) >= self._scaled_limit:
+                # keep limited users tracked so eviction cannot hand them a fresh quota
+                if user_id in states:
+                    states.move_to_end(user_id)
                 return False
 
-            # Add current request timestamp
-            user_requests.append(current_time)
+            states[user_id] = _pack(window_id, current + n, previous)
+            states.move_to_end(user_id)
+            if len(states) > self._max_users_per_shard:
+                states.popitem(last=False)
             return True
 
     def get_remaining_requests(self, user_id: str) -> int:
         """Get remaining requests for a user in current time window"""
-        with self._lock:
-            current_time = time.time()
-            user_requests = self._user_requests[user_id]
-
-            # Remove old requests
-            while user_requests and current_time - user_requests[0] > self.time_window:
-                user_requests.popleft()
+        # Counts are replaced as a single int, so a read needs no lock
+        counts = self._shard(user_id)[1].get(user_id)
+        if counts is None:
+            return self.max_requests
 
-            return max(0, self.max_requests - len(user_requests))
+        now_ns = time.monotonic_ns()
+        current, previous = self._current_counts(counts, now_ns // self.time_window_ns)
+        return max(0, (self._scaled_limit - self._scaled_count(current, previous, now_ns)) // self.time_window_ns)
 
     def get_reset_time(self, user_id: str) -> float:
-        """Get time when rate limit will reset for a user"""
-        with self._lock:
-            user_requests = self._user_requests[user_id]
-
-            if not user_requests or len(user_requests) < self.max_requests:
-                return 0
+        """Get time when the current window rolls over for a rate limited user, 0 otherwise"""
+        if self.get_remaining_requests(user_id) > 0:
+            return 0
 
-            return user_requests[0] + self.time_window
+        now_ns = time.monotonic_ns()
+        window_end_ns = (now_ns // self.time_window_ns + 1) * self.time_window_ns
+        # monotonic time has no epoch, so convert the remaining wait to wall-clock seconds
+        return time.time() + (window_end_ns - now_ns) / 1e9
 
     def clear_user_history(self, user_id: str):
         """Clear rate limiting history for a user (useful for testing)"""
-        with self._lock:
-            if user_id in self._user_requests:
-                del self._user_requests[user_id]
\ No newline at end of file
+        lock, states = self._shard(user_id)
+        with lock:
+            states.pop(user_id, None)
@@ -18,15 +18,15 @@ class SMSSender(NotificationSender):
             body = notification.get_formatted_message({})
 
             # Simulate email sending (in real world: SendGrid, SES, etc.)
-            logger.info(f"Sending email to {recipient_phone_no}")
-            logger.info(f"Subject: {subject}, Body: {body}")
+            logger.info("Sending email to %s", recipient_phone_no)
+            logger.info("Subject: %s, Body: %s", subject, body)
 
 
-            logger.info(f"Email sent successfully to {recipient_phone_no}")
+            logger.info("Email sent successfully to %s", recipient_phone_no)
             return True
 
         except Exception as e:
-            logger.error(f"Error sending email: {str(e)}")
+            logger.error("Error sending email: %s", e)
             return False
 
     def get_channel_type(self) -> str:
@@ -1,3 +1,5 @@
+import time
+
 from core.entities.notification_preference import NotificationPreference, NotificationChannelPreference, \
     NotificationTypePreference
 from core.entities.user import User
@@ -8,9 +10,13 @@ from core.interfaces.repositories.user_repository import UserRepository
 class UserService:
     def __init__(self,
                  user_repository: UserRepository,
-                 notification_preference_repository: NotificationPreferenceRepository):
+                 notification_preference_repository: NotificationPreferenceRepository,
+                 preference_cache_ttl: float = 60):
         self.user_repository = user_repository
         self.notification_preference_repository = notification_preference_repository
+        # user_id -> (monotonic time cached, preference); dropped when preferences are added
+        self.preference_cache_ttl = preference_cache_ttl
+        self._pref_cache: dict[str, tuple[float, NotificationPreference]] = {}
 
     def create_user(self, name: str, email: str) -> User:
         user = User(name=name, email=email)
@@ -24,6 +30,9 @@ class UserService:
     def get_user_by_id(self, user_id: str) -> User:
         return self.user_repository.find_by_id(user_id)
 
+    def get_users_by_ids(self, user_ids: list[str]) -> dict[str, User]:
+        return self.user_repository.find_by_ids(user_ids)
+
     def get_user_by_email(self, email: str) -> User:
         return self.user_repository.find_by_email(email)
 
@@ -36,9 +45,17 @@ class UserService:
             type_preference=type_preference
         )
         self.notification_preference_repository.save(notification_preference)
+        self._pref_cache.pop(user_id, None)
         return notification_preference
 
     def get_notification_preference_for_user(self, user_id: str) -> NotificationPreference:
+        now = time.monotonic()
+        cached = self._pref_cache.get(user_id)
+        if cached is not None and now - cached[0] < self.preference_cache_ttl:
+            return cached[1]
+
         notification_preference = self.notification_preference_repository.get_notification_preference_for_user_by_id(user_id)
+        if notification_preference is not None:
+            self._pref_cache[user_id] = (now, notification_preference)
         return notification_preference
 
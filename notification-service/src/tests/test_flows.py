@@ -1,4 +1,5 @@
-from core.entities.notification import NotificationChannelType, NotificationMessageType
+from core.entities.notification import (Notification, NotificationChannelType, NotificationMessage,
+                                        NotificationMessageType, NotificationStatus)
 from core.entities.notification_preference import NotificationChannelPreference, NotificationTypePreference
 from core.repositories.in_memory_notification_preference_repository import InMemoryNotificationPreferenceRepository
 from core.repositories.in_memory_notification_repository import InMemoryNotificationRepository
@@ -10,6 +11,8 @@ from core.services.user_service import UserService
 from core.factories.notification_sender_factory import NotificationSenderFactory
 from core.services.sender.rate_limiter import RateLimiter
 from core.services.notification_processor import NotificationProcessor
+from core.services.sender.sms_sender import SMSSender
+import asyncio
 import logging
 import time
 
@@ -181,6 +184,7 @@ def test_rate_limiting():
             print(f"   ❌ Message {i + 1}: {str(e)}")
 
     print(f"\n📊 Results: {successful_sends} successful, {failed_sends} failed")
+    assert (successful_sends, failed_sends) == (rate_limiter.max_requests, 12 - rate_limiter.max_requests)
 
     # Check remaining requests
     remaining = rate_limiter.get_remaining_requests(user.id)
@@ -203,7 +207,7 @@ def test_notification_history():
     for i, notification in enumerate(history, 1):
         status_emoji = "✅" if notification.status.name == "SENT" else "❌"
         print(f"   {i}. {status_emoji} '{notification.message.template}' via {notification.channel.name}")
-        print(f"      Status: {notification.status.name}, Created: {notification.created_at.strftime('%H:%M:%S')}")
+        print(f"      Status: {notification.status.name}, Created: {notification.created_at_dt.strftime('%H:%M:%S')}")
         if notification.retry_count > 0:
             print(f"      Retries: {notification.retry_count}")
 
@@ -259,6 +263,82 @@ def test_different_channels():
         print(f"❌ Failed to send friend request: {e}")
 
 
+def test_send_many():
+    """Test sending several notifications in one call"""
+    print("\n" + "=" * 50)
+    print("TESTING BULK SEND")
+    print("=" * 50)
+
+    user = user_service.get_user_by_email('abhijeetgurle@gmail.com')
+    receiver = user_service.get_user_by_email('ujjawal.khare@gmail.com')
+    rate_limiter.clear_user_history(user.id)
+
+    channel_count = len(user_service.get_notification_preference_for_user(user.id).channels_enabled)
+    sent_before = len(notification_service.get_notifications_sent_by_user(user.id))
+
+    # A batch with an unknown receiver is refused before the rate limit is charged
+    try:
+        notification_service.send_many(user.id, [(receiver.id, NotificationMessageType.MESSAGE, "Lost message"),
+                                                 ("no-such-user", NotificationMessageType.MESSAGE, "Lost message")])
+        assert False, "batch with an unknown receiver was accepted"
+    except ValueError as e:
+        print(f"✅ Batch with unknown receiver rejected: {str(e)}")
+    assert rate_limiter.get_remaining_requests(user.id) == rate_limiter.max_requests
+    assert len(notification_service.get_notifications_sent_by_user(user.id)) == sent_before
+
+    messages = [(receiver.id, NotificationMessageType.MESSAGE, f"Bulk message {i + 1}") for i in range(5)]
+    notification_service.send_many(user.id, messages)
+    print(f"✅ Sent {len(messages)} messages in one batch")
+    # every message in the accepted batch went out on every enabled channel
+    sent_after_batch = len(notification_service.get_notifications_sent_by_user(user.id))
+    assert sent_after_batch - sent_before == len(messages) * channel_count
+    remaining = rate_limiter.get_remaining_requests(user.id)
+    print(f"📈 Remaining requests for user: {remaining}")
+
+    # Empty or negative charges would leave the quota untouched or refund it, so they are refused
+    for n in (0, -2):
+        try:
+            rate_limiter.can_send_n(user.id, n)
+            assert False, f"can_send_n accepted n={n}"
+        except ValueError as e:
+            print(f"✅ can_send_n({n}) rejected: {str(e)}")
+    # only the sliding window's decay may move the count, never a refund
+    assert rate_limiter.get_remaining_requests(user.id) <= remaining + 1
+
+    # The whole batch is charged at once, so one that does not fit is rejected outright
+    try:
+        notification_service.send_many(user.id, messages * 2)
+        assert False, "oversized batch was not rate limited"
+    except Exception as e:
+        assert str(e) == f"Rate limit exceeded for user {user.id}", str(e)
+        print(f"✅ Oversized batch rejected: {str(e)}")
+    # none of the rejected batch's messages were sent
+    assert len(notification_service.get_notifications_sent_by_user(user.id)) == sent_after_batch
+
+
+def test_message_templates():
+    """Test that compiled templates render exactly like str.format"""
+    print("\n" + "=" * 50)
+    print("TESTING MESSAGE TEMPLATES")
+    print("=" * 50)
+
+    values = {"name": "Ujjwal", "w": "8", "count": 3}
+    templates = [
+        "Hello World!",
+        "Hi {name}!",
+        "Hi {name!r}, {count:03d} new {{likes}}",
+        "Hi {name:>{w}}!",
+        "Hi {name:{w}.{count}}!",
+    ]
+    for template in templates:
+        message = NotificationMessage(template=template)
+        rendered = message.set_template_with_values(values)
+        assert rendered == template.format(**values), f"{template!r} rendered as {rendered!r}"
+        # a second render goes through the cached segments
+        assert message.set_template_with_values(values) == rendered
+        print(f"   ✅ {template!r} -> {rendered!r}")
+
+
 def test_retry_mechanism():
     """Test retry mechanism (simulated)"""
     print("\n" + "=" * 50)
@@ -273,6 +353,16 @@ def test_retry_mechanism():
     print("- After 3 retries: Mark as permanently failed")
     print("\nThe concrete senders simulate random failures for testing.")
 
+    # A single notification goes through the same retry loop as a one-item batch
+    user = user_service.get_user_by_email('abhijeetgurle@gmail.com')
+    receiver = user_service.get_user_by_email('ujjawal.khare@gmail.com')
+    notification = Notification(source=user, dest=receiver, channel=NotificationChannelType.SMS,
+                                message=NotificationMessage(template="Processed on its own"))
+    assert asyncio.run(notification_processor.process_notification(notification, SMSSender()))
+    assert notification.status is NotificationStatus.SENT and notification.retry_count == 0
+    assert notification in notification_repository.get_notifications_for_user_by_id(user.id)
+    print("✅ Single notification processed and saved")
+
 
 def test_mark_as_read():
     """Test marking notifications as read"""
@@ -309,6 +399,8 @@ def run_all_tests():
         test_rate_limiting()
         test_notification_history()
         test_different_channels()
+        test_send_many()
+        test_message_templates()
         test_retry_mechanism()
         test_mark_as_read()
 
@@ -324,3 +416,4 @@ def run_all_tests():
 
 if __name__ == '__main__':
     run_all_tests()
+    notification_service.close()
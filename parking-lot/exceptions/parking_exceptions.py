@@ -1,14 +1,18 @@
-class ParkingLotFullException(Exception):
-    pass
+class ParkingException(Exception):
+    """Base class for all parking lot errors"""
+    __slots__ = ()
 
-class InvalidVehicleTypeException(Exception):
-    pass
+class ParkingLotFullException(ParkingException):
+    __slots__ = ()
 
-class GateNotAvailableException(Exception):
-    pass
+class InvalidVehicleTypeException(ParkingException):
+    __slots__ = ()
 
-class VehicleNotFoundException(Exception):
-    pass
+class GateNotAvailableException(ParkingException):
+    __slots__ = ()
 
-class InvalidSlotException(Exception):
-    pass
\ No newline at end of file
+class VehicleNotFoundException(ParkingException):
+    __slots__ = ()
+
+class InvalidSlotException(ParkingException):
+    __slots__ = ()
\ No newline at end of file
@@ -1,6 +1,7 @@
-import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
+from exceptions.parking_exceptions import ParkingException
 from managers.parking_lot import ParkingLot
 from models.vehicle import Car, Bike, Truck, Vehicle
 from strategies.implementation import NearestSpotStrategy
@@ -11,7 +12,7 @@ def simulate_vehicle_entry(parking_lot: ParkingLot, vehicle: Vehicle, delay: flo
     try:
         slot = parking_lot.park_vehicle(vehicle)
         print(f"Vehicle {vehicle.number} parked in slot {slot.slot_number}")
-    except Exception as e:
+    except ParkingException as e:
         print(f"Error parking vehicle {vehicle.number}: {str(e)}")
 
 def simulate_vehicle_exit(parking_lot: ParkingLot, vehicle: Vehicle, delay: float):
@@ -20,7 +21,7 @@ def simulate_vehicle_exit(parking_lot: ParkingLot, vehicle: Vehicle, delay: floa
     try:
         slot = parking_lot.remove_vehicle(vehicle)
         print(f"Vehicle {vehicle.number} removed from slot {slot.slot_number}")
-    except Exception as e:
+    except ParkingException as e:
         print(f"Error remove vehicle {vehicle.number}: {str(e)}")
 
 
@@ -43,28 +44,14 @@ def main():
         Bike("BIKE002")
     ]
 
-    # Simulate concurrent parking operations
-    threads = []
-    for i, vehicle in enumerate(vehicles):
-        # Create entry thread
-        entry_thread = threading.Thread(
-            target=simulate_vehicle_entry,
-            args=(parking_lot, vehicle, i * 0.5)
-        )
-        threads.append(entry_thread)
-        entry_thread.start()
+    # Simulate concurrent parking operations on a bounded pool of workers
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for i, vehicle in enumerate(vehicles):
+            pool.submit(simulate_vehicle_entry, parking_lot, vehicle, i * 0.5)
 
-        # Create exit thread (after some delay)
-        exit_thread = threading.Thread(
-            target=simulate_vehicle_exit,
-            args=(parking_lot, vehicle, i * 0.5 + 2.0)
-        )
-        threads.append(exit_thread)
-        exit_thread.start()
-
-    # Wait for all threads to complete
-    for thread in threads:
-        thread.join()
+            # Schedule exit (after some delay)
+            pool.submit(simulate_vehicle_exit, parking_lot, vehicle, i * 0.5 + 2.0)
+    # Leaving the with block waits for all operations to complete
 
     # Print final status
     print("\nFinal Parking Lot Status:")
@@ -1,12 +1,16 @@
+import queue
 import threading
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Sequence, Union
 
-from exceptions.parking_exceptions import ParkingLotFullException, InvalidVehicleTypeException, \
-    GateNotAvailableException, VehicleNotFoundException, InvalidSlotException
-from models.parking_gate import EntryGate, ExitGate
-from models.parking_slot import ParkingSlot, CarSlot
+from enums.vehicle_type import VehicleType
+from exceptions.parking_exceptions import ParkingException, ParkingLotFullException, \
+    InvalidVehicleTypeException, GateNotAvailableException, VehicleNotFoundException, InvalidSlotException
+from models.parking_gate import Gate
+from models.parking_slot import ParkingSlot
 from models.vehicle import Vehicle
-from strategies.base import ParkingStrategy
+from strategies.base import FreeSlots, ParkingStrategy
+
+_VEHICLE_LOCK_SHARDS = 16  # must be a power of two
 
 
 class ParkingLot:
@@ -17,75 +21,152 @@ class ParkingLot:
             number_of_entries: int,
             number_of_exits: int,
             parking_strategy: ParkingStrategy,
+            slot_type_plan: Optional[Sequence[VehicleType]] = None,
     ):
         if levels <= 0 or slots_per_level <= 0:
             raise ValueError("Levels and slots per level must be positive")
         if number_of_entries <= 0 or number_of_exits <= 0:
             raise ValueError("Number of entries and exits must be positive")
+        if slot_type_plan is None:
+            slot_type_plan = [VehicleType.CAR] * slots_per_level
+        elif len(slot_type_plan) != slots_per_level:
+            raise ValueError("Slot type plan must give a type for every slot in a level")
 
         self._levels = levels
         self._slots_per_level = slots_per_level
         self._parking_strategy = parking_strategy
 
         # Initialize gates
-        self._entries = [EntryGate(i) for i in range(number_of_entries)]
-        self._exits = [ExitGate(i) for i in range(number_of_exits)]
+        self._entries = [Gate(i) for i in range(number_of_entries)]
+        self._exits = [Gate(i) for i in range(number_of_exits)]
 
         # Initialize slots
-        self._slots = self._initialize_slots()
-        self._available_slots = levels * slots_per_level
-
-        # Thread safety
-        self._lot_lock = threading.Lock()  # Lock for entire parking lot operations
-        self._gate_locks = {  # Individual locks for each gate
-            'entry': [threading.Lock() for _ in range(number_of_entries)],
-            'exit': [threading.Lock() for _ in range(number_of_exits)]
-        }
+        self._slots = self._initialize_slots(slot_type_plan)
+        self._available_by_level = [slots_per_level] * levels
+
+        # Free slots per level and vehicle type, maintained by the strategy on park and remove
+        self._free_by_level: List[FreeSlots] = []
+        for level_slots in self._slots:
+            free_slots: FreeSlots = {vehicle_type: [] for vehicle_type in VehicleType}
+            for slot in level_slots:
+                self._parking_strategy.release_spot(slot, free_slots)
+            self._free_by_level.append(free_slots)
+
+        # Thread safety: each level's lock guards its slots, free slots and count, and
+        # a vehicle's shard lock serializes parking and removing that vehicle.
+        # Shard locks are always taken before level locks.
+        self._level_locks = [threading.Lock() for _ in range(levels)]
+        self._vehicle_locks = [threading.Lock() for _ in range(_VEHICLE_LOCK_SHARDS)]
+
+        # Gates that are free to use; taking a gate out of its queue is what claims it
+        self._free_entry_gates: "queue.SimpleQueue[Gate]" = queue.SimpleQueue()
+        self._free_exit_gates: "queue.SimpleQueue[Gate]" = queue.SimpleQueue()
+        for entry_gate in self._entries:
+            self._free_entry_gates.put(entry_gate)
+        for exit_gate in self._exits:
+            self._free_exit_gates.put(exit_gate)
 
         # Tracking
         self._vehicle_to_slot: Dict[str, Tuple[int, int]] = {}  # vehicle_number -> (level, slot_number)
 
-    def _initialize_slots(self) -> List[List[ParkingSlot]]:
-        """Initialize parking slots for all levels."""
+    def _initialize_slots(self, slot_type_plan: Sequence[VehicleType]) -> List[List[ParkingSlot]]:
+        """Initialize parking slots for all levels, laying out each level by slot_type_plan."""
         slots = []
         slot_number = 0
         for level in range(self._levels):
             level_slots = []
-            for _ in range(self._slots_per_level):
-                # In a real implementation, you might want to create different types of slots
-                # based on some configuration or pattern
-                level_slots.append(CarSlot(slot_number, level))
+            for index_in_level, slot_type in enumerate(slot_type_plan):
+                level_slots.append(ParkingSlot(slot_number, level, index_in_level, slot_type))
                 slot_number += 1
             slots.append(level_slots)
         return slots
 
-    def _get_available_entry_gate(self) -> Optional[EntryGate]:
-        """Get an available entry gate with proper locking."""
-        for i, gate in enumerate(self._entries):
-            with self._gate_locks['entry'][i]:
-                if gate.is_available:
-                    gate.block_gate()
-                    return gate
+    def _get_available_entry_gate(self) -> Optional[Gate]:
+        """Take a free entry gate off the queue, if there is one."""
+        try:
+            gate = self._free_entry_gates.get_nowait()
+        except queue.Empty:
+            return None
+        gate.is_available = False
+        return gate
+
+    def _get_available_exit_gate(self) -> Optional[Gate]:
+        """Take a free exit gate off the queue, if there is one."""
+        try:
+            gate = self._free_exit_gates.get_nowait()
+        except queue.Empty:
+            return None
+        gate.is_available = False
+        return gate
+
+    def _release_entry_gate(self, gate: Gate) -> None:
+        """Return an entry gate to the free queue."""
+        gate.is_available = True
+        self._free_entry_gates.put(gate)
+
+    def _release_exit_gate(self, gate: Gate) -> None:
+        """Return an exit gate to the free queue."""
+        gate.is_available = True
+        self._free_exit_gates.put(gate)
+
+    def _vehicle_lock(self, vehicle: Vehicle) -> threading.Lock:
+        return self._vehicle_locks[hash(vehicle.number) & (_VEHICLE_LOCK_SHARDS - 1)]
+
+    def _take_spot(self, vehicle: Vehicle) -> Optional[ParkingSlot]:
+        """Claim a slot on the lowest level that has one free, locking only that level."""
+        vehicle_type = vehicle.type
+        for level, free_slots in enumerate(self._free_by_level):
+            # Unlocked peek to skip levels with nothing free; re-checked under the lock
+            if not free_slots[vehicle_type]:
+                continue
+            with self._level_locks[level]:
+                spot = self._parking_strategy.find_spot(vehicle, free_slots)
+                if spot:
+                    spot.assign_vehicle(vehicle)
+                    self._available_by_level[level] -= 1
+                    return spot
         return None
 
-    def _get_available_exit_gate(self) -> Optional[ExitGate]:
-        """Get an available exit gate with proper locking."""
-        for i, gate in enumerate(self._exits):
-            with self._gate_locks['exit'][i]:
-                if gate.is_available:
-                    gate.block_gate()
-                    return gate
-        return None
+    def _check_can_park(self, vehicle: Vehicle) -> None:
+        if not any(self._available_by_level):
+            raise ParkingLotFullException("Parking lot is full")
+
+        if vehicle.number in self._vehicle_to_slot:
+            raise InvalidVehicleTypeException("Vehicle is already parked")
+
+    def _park_through_gate(self, vehicle: Vehicle) -> ParkingSlot:
+        """Park a vehicle once it holds its shard lock and an entry gate."""
+        spot = self._take_spot(vehicle)
+
+        if not spot:
+            raise InvalidVehicleTypeException("No suitable spot found for vehicle type")
+
+        # Update tracking
+        self._vehicle_to_slot[vehicle.number] = (spot.level, spot.index_in_level)
+
+        return spot
+
+    def _check_is_parked(self, vehicle: Vehicle) -> None:
+        if vehicle.number not in self._vehicle_to_slot:
+            raise VehicleNotFoundException("Vehicle not found in parking lot")
 
-    def _release_entry_gate(self, gate: EntryGate) -> None:
-        """Release an entry gate with proper locking."""
-        with self._gate_locks['entry'][gate.number]:
-            gate.release_gate()
+    def _remove_through_gate(self, vehicle: Vehicle) -> ParkingSlot:
+        """Remove a vehicle once it holds its shard lock and an exit gate."""
+        level, slot_idx = self._vehicle_to_slot[vehicle.number]
+        slot = self._slots[level][slot_idx]
 
-    def _release_exit_gate(self, gate: ExitGate) -> None:
-        """Release an exit gate with proper locking."""
-        with self._gate_locks['exit'][gate.number]:
-            gate.release_gate()
+        with self._level_locks[level]:
+            if not slot.is_vehicle_parked(vehicle):
+                raise InvalidSlotException("Vehicle not found in expected slot")
+
+            slot.exit_vehicle()
+            self._parking_strategy.release_spot(slot, self._free_by_level[level])
+            self._available_by_level[level] += 1
+
+        # Update tracking
+        del self._vehicle_to_slot[vehicle.number]
+
+        return slot
 
     def park_vehicle(self, vehicle: Vehicle) -> Optional[ParkingSlot]:
         """
@@ -102,12 +183,10 @@ class ParkingLot:
                 GateNotAvailableException: If no entry gates are available
                 InvalidVehicleTypeException: If vehicle type is not supported
         """
-        with self._lot_lock:
-            if self._available_slots == 0:
-                raise ParkingLotFullException("Parking lot is full")
-
-            if vehicle.number in self._vehicle_to_slot:
-                raise InvalidVehicleTypeException("Vehicle is already parked")
+        # Unlocked fast reject; repeated under the lock, which is authoritative
+        self._check_can_park(vehicle)
+        with self._vehicle_lock(vehicle):
+            self._check_can_park(vehicle)
 
             # Get entry gate
             entry_gate = self._get_available_entry_gate()
@@ -115,40 +194,52 @@ class ParkingLot:
                 raise GateNotAvailableException("No entry gates available")
 
             try:
-                # Flatten slots list for strategy
-                all_slots = [slot for level in self._slots for slot in level]
-                spot = self._parking_strategy.find_spot(vehicle, all_slots)
-
-                if not spot:
-                    raise InvalidVehicleTypeException("No suitable spot found for vehicle type")
-
-                for level_idx, level in enumerate(self._slots):
-                    for slot_idx, slot in enumerate(level):
-                        if slot == spot:
-                            # Update tracking
-                            self._vehicle_to_slot[vehicle.number] = (level_idx, slot_idx)
-
-                            # Park the vehicle
-                            spot.assign_vehicle(vehicle)
-                            self._available_slots -= 1
-
-                            return spot
-
-            except Exception as e:
-                # If anything goes wrong, release the gate
-                self._release_entry_gate(entry_gate)
-                raise e
+                return self._park_through_gate(vehicle)
             finally:
                 # Always release the gate
                 self._release_entry_gate(entry_gate)
 
-            return None
+    def park_vehicles(self, vehicles: List[Vehicle]) -> List[Union[ParkingSlot, ParkingException]]:
+        """
+            Park a group of vehicles through a single entry gate.
+
+            Args:
+                vehicles: The vehicles to park, in arrival order
+
+            Returns:
+                For each vehicle, the slot it was parked in or the ParkingException
+                that kept it out; one vehicle failing does not stop the rest
+
+            Raises:
+                GateNotAvailableException: If no entry gates are available
+        """
+        if not vehicles:
+            return []
+
+        entry_gate = self._get_available_entry_gate()
+        if not entry_gate:
+            raise GateNotAvailableException("No entry gates available")
+
+        results: List[Union[ParkingSlot, ParkingException]] = []
+        try:
+            for vehicle in vehicles:
+                try:
+                    with self._vehicle_lock(vehicle):
+                        self._check_can_park(vehicle)
+                        results.append(self._park_through_gate(vehicle))
+                except ParkingException as e:
+                    results.append(e)
+        finally:
+            self._release_entry_gate(entry_gate)
+
+        return results
 
     def remove_vehicle(self, vehicle: Vehicle) -> Optional[ParkingSlot]:
         """Remove a vehicle from the parking lot."""
-        with self._lot_lock:
-            if vehicle.number not in self._vehicle_to_slot:
-                raise VehicleNotFoundException("Vehicle not found in parking lot")
+        # Unlocked fast reject; repeated under the lock, which is authoritative
+        self._check_is_parked(vehicle)
+        with self._vehicle_lock(vehicle):
+            self._check_is_parked(vehicle)
 
             # Get exit gate
             exit_gate = self._get_available_exit_gate()
@@ -156,29 +247,39 @@ class ParkingLot:
                 raise GateNotAvailableException("No exit gates available")
 
             try:
-                level, slot_idx = self._vehicle_to_slot[vehicle.number]
-                slot = self._slots[level][slot_idx]
-
-                if not slot.is_vehicle_parked(vehicle):
-                    raise InvalidSlotException("Vehicle not found in expected slot")
-
-                slot.exit_vehicle()
-                self._available_slots += 1
-
-                # Update tracking
-                del self._vehicle_to_slot[vehicle.number]
-
-                return slot
-
-            except Exception as e:
-                self._release_exit_gate(exit_gate)
-                raise e
+                return self._remove_through_gate(vehicle)
             finally:
+                # Always release the gate
                 self._release_exit_gate(exit_gate)
 
-            return None
+    def remove_vehicles(self, vehicles: List[Vehicle]) -> List[Union[ParkingSlot, ParkingException]]:
+        """Remove a group of vehicles through a single exit gate, reporting a slot or error per vehicle."""
+        if not vehicles:
+            return []
+
+        exit_gate = self._get_available_exit_gate()
+        if not exit_gate:
+            raise GateNotAvailableException("No exit gates available")
+
+        results: List[Union[ParkingSlot, ParkingException]] = []
+        try:
+            for vehicle in vehicles:
+                try:
+                    with self._vehicle_lock(vehicle):
+                        self._check_is_parked(vehicle)
+                        results.append(self._remove_through_gate(vehicle))
+                except ParkingException as e:
+                    results.append(e)
+        finally:
+            self._release_exit_gate(exit_gate)
+
+        return results
 
     def get_available_slots(self) -> int:
-        """Get the number of available slots."""
-        with self._lot_lock:
-            return self._available_slots
\ No newline at end of file
+        """
+            Get the number of available slots.
+
+            Reads the per-level counts without locking, so under concurrent parks
+            and removes the total may miss an in-flight change.
+        """
+        return sum(self._available_by_level)
\ No newline at end of file
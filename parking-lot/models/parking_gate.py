@@ -1,38 +1,7 @@
-from abc import ABC, abstractmethod
+class Gate:
+    """An entry or exit gate; the lot's free-gate queues decide which kind it is."""
+    __slots__ = ('number', 'is_available')
 
-class ParkingGate(ABC):
-    def __init__(self, number: int) -> None:
-        self._number = number
-        self._is_available = True
-
-    @property
-    def number(self) -> int:
-        return self._number
-
-    @property
-    def is_available(self) -> bool:
-        return self._is_available
-
-    @abstractmethod
-    def block_gate(self) -> None:
-        pass
-
-    @abstractmethod
-    def release_gate(self) -> None:
-        pass
-
-
-class EntryGate(ParkingGate):
-    def block_gate(self) -> None:
-        self._is_available = False
-
-    def release_gate(self) -> None:
-        self._is_available = True
-
-
-class ExitGate(ParkingGate):
-    def block_gate(self) -> None:
-        self._is_available = False
-
-    def release_gate(self) -> None:
-        self._is_available = True
\ No newline at end of file
+    def __init__(self, number: int, is_available: bool = True):
+        self.number = number
+        self.is_available = is_available
@@ -1,106 +1,41 @@
-from abc import ABC, abstractmethod
+from typing import Dict, FrozenSet, Optional
 
 from enums.vehicle_type import VehicleType
 from models.vehicle import Vehicle
 
+# Vehicle types each kind of slot can hold
+ACCEPTED_VEHICLES: Dict[VehicleType, FrozenSet[VehicleType]] = {
+    VehicleType.CAR: frozenset({VehicleType.CAR}),
+    VehicleType.BIKE: frozenset({VehicleType.BIKE}),
+    VehicleType.TRUCK: frozenset({VehicleType.TRUCK}),
+}
 
-class ParkingSlot(ABC):
-    def __init__(self, slot_number: int, level: int):
-        self._slot_number = slot_number
-        self._level = level
-        self._is_available = True
-        self._vehicle = None
 
-    @property
-    def slot_number(self) -> int:
-        return self._slot_number
+class ParkingSlot:
+    __slots__ = ('slot_number', 'level', 'index_in_level', 'type', 'is_available', 'vehicle')
 
-    @property
-    @abstractmethod
-    def type(self) -> VehicleType:
-        pass
+    def __init__(self, slot_number: int, level: int, index_in_level: int, type: VehicleType,
+                 is_available: bool = True, vehicle: Optional[Vehicle] = None):
+        self.slot_number = slot_number
+        self.level = level
+        self.index_in_level = index_in_level
+        self.type = type
+        self.is_available = is_available
+        self.vehicle = vehicle
 
-    @abstractmethod
     def can_assign_vehicle(self, vehicle: Vehicle) -> bool:
-        pass
-
-    @abstractmethod
-    def assign_vehicle(self, vehicle: Vehicle) -> None:
-        pass
-
-    @abstractmethod
-    def exit_vehicle(self) -> None:
-        pass
-
-    @abstractmethod
-    def is_vehicle_parked(self, vehicle: Vehicle) -> bool:
-        pass
-
-
-class CarSlot(ParkingSlot):
-    @property
-    def type(self) -> VehicleType:
-        return VehicleType.CAR
-
-    def can_assign_vehicle(self, vehicle: Vehicle) -> bool:
-        return self._is_available and vehicle.type == VehicleType.CAR
-
-    def assign_vehicle(self, vehicle: Vehicle) -> None:
-        if not self.can_assign_vehicle(vehicle):
-            raise ValueError('cannot assign vehicle to this slot')
-
-        self._is_available = False
-        self._vehicle = vehicle
-
-    def exit_vehicle(self) -> None:
-        self._is_available = True
-        self._vehicle = None
-
-    def is_vehicle_parked(self, vehicle: Vehicle) -> bool:
-        return not self._is_available and vehicle.number == self._vehicle.number
-
-
-class BikeSlot(ParkingSlot):
-    @property
-    def type(self) -> VehicleType:
-        return VehicleType.BIKE
-
-    def can_assign_vehicle(self, vehicle: Vehicle) -> bool:
-        return self._is_available and vehicle.type == VehicleType.BIKE
-
-    def assign_vehicle(self, vehicle: Vehicle) -> None:
-        if not self.can_assign_vehicle(vehicle):
-            raise ValueError('cannot assign vehicle to this slot')
-
-        self._is_available = False
-        self._vehicle = vehicle
-
-    def exit_vehicle(self) -> None:
-        self._is_available = True
-        self._vehicle = None
-
-    def is_vehicle_parked(self, vehicle: Vehicle) -> bool:
-        return not self._is_available and vehicle.number == self._vehicle.number
-
-
-class TruckSlot(ParkingSlot):
-    @property
-    def type(self) -> VehicleType:
-        return VehicleType.TRUCK
-
-    def can_assign_vehicle(self, vehicle: Vehicle) -> bool:
-        return self._is_available and vehicle.type == VehicleType.TRUCK
+        return self.is_available and vehicle.type in ACCEPTED_VEHICLES[self.type]
 
     def assign_vehicle(self, vehicle: Vehicle) -> None:
         if not self.can_assign_vehicle(vehicle):
             raise ValueError('cannot assign vehicle to this slot')
 
-        self._is_available = False
-        self._vehicle = vehicle
+        self.is_available = False
+        self.vehicle = vehicle
 
     def exit_vehicle(self) -> None:
-        self._is_available = True
-        self._vehicle = None
+        self.is_available = True
+        self.vehicle = None
 
     def is_vehicle_parked(self, vehicle: Vehicle) -> bool:
-        return not self._is_available and vehicle.number == self._vehicle.number
\ No newline at end of file
+        return not self.is_available and vehicle.number == self.vehicle.number
\ No newline at end of file
@@ -1,4 +1,4 @@
-from abc import ABC, abstractmethod
+from abc import ABC
 
 from enums.vehicle_type import VehicleType
 
@@ -7,13 +7,13 @@ class Vehicle(ABC):
     """
     Abstract class for a vehicle.
     """
+    __slots__ = ('_number',)
+
     def __init__(self, number: str):
         self._number = number
 
-    @property
-    @abstractmethod
-    def type(self) -> VehicleType:
-        pass
+    # Each concrete vehicle sets this as a plain class attribute, so reading it is not a call
+    type: VehicleType
 
     @property
     def number(self) -> str:
@@ -21,19 +21,16 @@ class Vehicle(ABC):
 
 
 class Car(Vehicle):
-    @property
-    def type(self) -> VehicleType:
-        return VehicleType.CAR
+    __slots__ = ()
+    type = VehicleType.CAR
 
 
 class Bike(Vehicle):
-    @property
-    def type(self) -> VehicleType:
-        return VehicleType.BIKE
+    __slots__ = ()
+    type = VehicleType.BIKE
 
 
 class Truck(Vehicle):
-    @property
-    def type(self) -> VehicleType:
-        return VehicleType.TRUCK
+    __slots__ = ()
+    type = VehicleType.TRUCK
 
@@ -1,11 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Optional
 
+from enums.vehicle_type import VehicleType
 from models.parking_slot import ParkingSlot
 from models.vehicle import Vehicle
 
+# Free slots for each vehicle type, laid out however the strategy prefers
+FreeSlots = Dict[VehicleType, list]
+
 
 class ParkingStrategy(ABC):
     @abstractmethod
-    def find_spot(self, vehicle: Vehicle, slots: List[ParkingSlot]) -> Optional[ParkingSlot]:
-        pass
\ No newline at end of file
+    def find_spot(self, vehicle: Vehicle, free_slots: FreeSlots) -> Optional[ParkingSlot]:
+        """Take a free slot for the vehicle out of free_slots, or return None if there is none."""
+        pass
+
+    @abstractmethod
+    def release_spot(self, slot: ParkingSlot, free_slots: FreeSlots) -> None:
+        """Put a slot that has become free back into free_slots."""
+        pass
@@ -1,14 +1,19 @@
-from typing import List, Optional
+import heapq
+from typing import Optional
 
 from models.parking_slot import ParkingSlot
 from models.vehicle import Vehicle
-from strategies.base import ParkingStrategy
+from strategies.base import FreeSlots, ParkingStrategy
 
 
 class NearestSpotStrategy(ParkingStrategy):
-    def find_spot(self, vehicle: Vehicle, slots: List[ParkingSlot]) -> Optional[ParkingSlot]:
-        for slot in slots:
-            if slot.can_assign_vehicle(vehicle):
-                return slot
+    # Free slots are min-heaps of (slot_number, slot), so the nearest is always on top
+    def find_spot(self, vehicle: Vehicle, free_slots: FreeSlots) -> Optional[ParkingSlot]:
+        heap = free_slots[vehicle.type]
+        if heap:
+            return heapq.heappop(heap)[1]
 
-        return None
\ No newline at end of file
+        return None
+
+    def release_spot(self, slot: ParkingSlot, free_slots: FreeSlots) -> None:
+        heapq.heappush(free_slots[slot.type], (slot.slot_number, slot))
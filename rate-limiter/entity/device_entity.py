@@ -5,6 +5,8 @@ class DeviceEntity(Entity):
     """
     Represents a device in the system.
     """
+    __slots__ = ('device_id', 'device_name')
+
     def __init__(self, device_id: str, device_name: str):
         self.device_id = device_id
         self.device_name = device_name
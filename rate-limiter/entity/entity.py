@@ -5,6 +5,8 @@ class Entity(ABC):
     """
     Base class for all entity in the system.
     """
+    __slots__ = ()
+
     @abstractmethod
     def get_id(self) -> str:
         """
@@ -5,6 +5,8 @@ class IPEntity(Entity):
     """
     Represents an IP address in the system.
     """
+    __slots__ = ('ip_address',)
+
     def __init__(self, ip_address: str):
         self.ip_address = ip_address
 
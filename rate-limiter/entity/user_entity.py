@@ -5,6 +5,8 @@ class UserEntity(Entity):
     """
     Represents a user in the system.
     """
+    __slots__ = ('user_id', 'username')
+
     def __init__(self, user_id: str, username: str):
         self.user_id = user_id
         self.username = username
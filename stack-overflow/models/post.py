@@ -1,5 +1,5 @@
 import uuid
-from typing import List
+from typing import Dict, List
 
 from enums.post_type import PostType
 from models.user import User
@@ -14,6 +14,10 @@ class Post:
         self._type = type
         self._reputation_strategy = reputation_strategy
 
+    @property
+    def id(self):
+        return self._id
+
     @property
     def content(self):
         return self._contents
@@ -36,15 +40,16 @@ class Answer(Post):
     def __init__(self, contents: str, user: User, answer_reputation_strategy: ReputationStrategy):
         super().__init__(contents, user, PostType.ANSWER, answer_reputation_strategy)
         self._votes = 0
-        self._comments: List[Comment] = []
+        # Keyed by post id so deletes don't scan; dicts keep insertion order
+        self._comments: Dict[str, Comment] = {}
 
     def add_comment(self, comment: Comment):
         comment.user.increment_reputation(self._reputation_strategy.on_post())
-        self._comments.append(comment)
+        self._comments[comment.id] = comment
 
     def delete_comment(self, comment: Comment):
         comment.user.decrement_reputation(self._reputation_strategy.on_delete())
-        self._comments.remove(comment)
+        del self._comments[comment.id]
 
     def upvote(self):
         self._reputation_strategy.on_upvote()
@@ -60,33 +65,36 @@ class Question(Post):
         super().__init__(contents, user, PostType.QUESTION, question_reputation_strategy)
         self._votes = 0
         self._tags = tags
-        self._answers: list[Answer] = []
-        self._comments: list[Comment] = []
+        # Lowercased once for case-insensitive keyword search
+        self._contents_lower = contents.lower()
+        # Keyed by post id so removals don't scan; dicts keep insertion order
+        self._answers: Dict[str, Answer] = {}
+        self._comments: Dict[str, Comment] = {}
 
     @property
-    def answers(self):
-        return self._answers
+    def answers(self) -> List[Answer]:
+        return list(self._answers.values())
 
     @property
-    def comments(self):
-        return self._comments
+    def comments(self) -> List[Comment]:
+        return list(self._comments.values())
 
     def add_answer(self, answer: Answer):
         answer.user.increment_reputation(answer._reputation_strategy.on_post())
-        self._answers.append(answer)
+        self._answers[answer.id] = answer
 
     def remove_answer(self, answer: Answer):
         answer.user.decrement_reputation(answer._reputation_strategy.on_delete())
-        self._answers.remove(answer)
+        del self._answers[answer.id]
 
     def add_comment(self, comment: Comment):
         comment.user.increment_reputation(comment._reputation_strategy.on_post())
-        self._comments.append(comment)
+        self._comments[comment.id] = comment
 
     def delete_comment(self, comment: Comment):
         print("comment: ", comment)
         comment.user.decrement_reputation(comment._reputation_strategy.on_delete())
-        self._comments.remove(comment)
+        del self._comments[comment.id]
 
     def upvote(self):
         self.user.increment_reputation(self._reputation_strategy.on_upvote())
@@ -97,7 +105,15 @@ class Question(Post):
         self._votes -= 1
 
     def is_keyword_in_question(self, keyword: str) -> bool:
-        return keyword in self._contents
+        return keyword.lower() in self._contents_lower
+
+    @property
+    def content_lower(self) -> str:
+        return self._contents_lower
+
+    @property
+    def tags(self) -> List[str]:
+        return self._tags
 
     def is_tag_in_question(self, tag: str) -> bool:
         return tag in self._tags
@@ -1,11 +1,21 @@
+from collections import OrderedDict, defaultdict
+
 from models.post import Question, Answer, Comment
 from models.user import User
 from strategy.reputation_strategy import ReputationStrategy
 
 
+_KEYWORD_CACHE_SIZE = 1024
+
+
 class StackOverflow:
     def __init__(self, question_reputation_strategy: ReputationStrategy, answer_reputation_strategy: ReputationStrategy, comment_reputation_strategy: ReputationStrategy):
         self._questions: list[Question] = []
+        # Search indexes, filled as questions are added
+        self._questions_by_tag: defaultdict[str, list[Question]] = defaultdict(list)
+        self._questions_by_user: defaultdict[str, list[Question]] = defaultdict(list)
+        # Recent keyword search results, least recently used first; cleared when a question is added
+        self._keyword_cache: OrderedDict[str, list[Question]] = OrderedDict()
         self._comment_reputation_strategy: ReputationStrategy = comment_reputation_strategy
         self._answer_reputation_strategy: ReputationStrategy = answer_reputation_strategy
         self._question_reputation_strategy: ReputationStrategy = question_reputation_strategy
@@ -13,6 +23,10 @@ class StackOverflow:
     def add_question(self, question: Question):
         question.user.increment_reputation(self._question_reputation_strategy.on_post())
         self._questions.append(question)
+        for tag in dict.fromkeys(question.tags):
+            self._questions_by_tag[tag].append(question)
+        self._questions_by_user[question.user.id].append(question)
+        self._keyword_cache.clear()
 
     def answer_question(self, question: Question, answer: Answer):
         question.add_answer(answer)
@@ -36,26 +50,21 @@ class StackOverflow:
         return question.comments
 
     def search_question_on_keyword(self, keyword: str) -> list[Question]:
-        res = []
-
-        for question in self._questions:
-            if question.is_keyword_in_question(keyword):
-                res.append(question)
-
-        return res
+        """Questions whose content contains keyword, ignoring case"""
+        keyword = keyword.lower()
+        res = self._keyword_cache.get(keyword)
+        if res is None:
+            res = [question for question in self._questions if keyword in question.content_lower]
+            self._keyword_cache[keyword] = res
+            if len(self._keyword_cache) > _KEYWORD_CACHE_SIZE:
+                self._keyword_cache.popitem(last=False)
+        else:
+            self._keyword_cache.move_to_end(keyword)
+
+        return list(res)
 
     def search_question_on_tag(self, tag: str) -> list[Question]:
-        res = []
-        for question in self._questions:
-            if question.is_tag_in_question(tag):
-                res.append(question)
-
-        return res
+        return list(self._questions_by_tag.get(tag, ()))
 
     def search_question_on_user(self, user: User) -> list[Question]:
-        res = []
-        for question in self._questions:
-            if question.is_user_question(user):
-                res.append(question)
-
-        return res
\ No newline at end of file
+        return list(self._questions_by_user.get(user.id, ()))
\ No newline at end of file
@@ -2,19 +2,21 @@ class ReputationStrategy:
     def __init__(self, increment: int, multiplier: float):
         self._increment = increment
         self._multiplier = multiplier
+        # Every event moves reputation by the same amount, so work it out once
+        self._delta = increment * multiplier
 
     @property
     def multiplier(self):
         return self._multiplier
 
     def on_post(self):
-        return self._multiplier * self._increment
+        return self._delta
 
     def on_upvote(self):
-        return self._increment * self._multiplier
+        return self._delta
 
     def on_downvote(self):
-        return self._increment * self._multiplier
+        return self._delta
 
     def on_delete(self):
-        return self._increment * self._multiplier
\ No newline at end of file
+        return self._delta
\ No newline at end of file